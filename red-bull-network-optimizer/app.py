@@ -3,26 +3,156 @@ Red Bull Network Optimizer - Flask API
 Serves both the web interface and RESTful API endpoints.
 """
 
-from flask import Flask, render_template, jsonify, request, send_file
+from flask import Flask, Response, render_template, jsonify, request, send_file
 from flask_cors import CORS
+from cachetools import TTLCache
+from threading import Lock, Thread
+from functools import lru_cache
+from itertools import compress
+import logging
+import hashlib
+import gzip
+import numpy as np
+import pandas as pd
+import xlsxwriter
 import sys
 import os
+import io
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from optimization.scenario_engine import ScenarioEngine
+from utils.json_provider import ORJSONProvider
+from utils.schemas import OptimizeResponse, SolutionSummary, encoder as optimize_encoder
 from config import Config
 
+logging.basicConfig(level=logging.INFO)
+
 app = Flask(__name__)
 app.config.from_object(Config)
+app.json = ORJSONProvider(app)
 CORS(app)
 
 # Initialize scenario engine
-scenario_engine = ScenarioEngine(data_dir='data')
+scenario_engine = ScenarioEngine(data_dir='data', solver=Config.SOLVER)
+
+# Cache for storing results (bounded + expiring, shared across request threads)
+results_cache = TTLCache(maxsize=Config.RESULTS_CACHE_SIZE, ttl=Config.RESULTS_CACHE_TTL)
+_cache_lock = Lock()
+
+
+def get_cached_result(scenario_id):
+    """Return the cached result for a scenario, or None if missing/expired."""
+    with _cache_lock:
+        return results_cache.get(scenario_id)
+
+
+def cache_result(scenario_id, result):
+    """Store a scenario result in the shared cache."""
+    with _cache_lock:
+        results_cache[scenario_id] = result
+
+
+def warm_baseline():
+    """Solve the baseline in the background so the first dashboard load is served from cache."""
+    try:
+        if get_cached_result('baseline') is None:
+            cache_result('baseline', scenario_engine.run_scenario('baseline'))
+    except Exception:
+        app.logger.exception("Baseline warm-up failed")
+
+
+def is_reloader_parent():
+    """True in the `python app.py` debug process that only watches files and respawns the server."""
+    return __name__ == '__main__' and Config.DEBUG and os.environ.get('WERKZEUG_RUN_MAIN') != 'true'
+
+
+# Overlap the baseline solve with server startup (WARM_BASELINE=0 disables it, e.g. under test)
+if Config.WARM_BASELINE and not is_reloader_parent():
+    Thread(target=warm_baseline, daemon=True).start()
+
+
+def network_table_path(name):
+    """Path to load a network table from, preferring the Parquet copy from generate_data.py when it is up to date."""
+    csv_path = os.path.join('data', f'{name}.csv')
+    parquet_path = os.path.join('data', f'{name}.parquet')
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+        return parquet_path
+    return csv_path
+
+
+def read_network_table(path):
+    """Read a network table from a CSV or Parquet file."""
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path, engine='pyarrow')
+    return pd.read_csv(path)
+
+
+# Static network topology, parsed once at startup (only changes when generate_data.py is rerun)
+network_sources = {
+    'plants': network_table_path('plants'),
+    'dcs': network_table_path('distribution_centers'),
+    'markets': network_table_path('markets')
+}
+network_records = {key: read_network_table(path).to_dict('records') for key, path in network_sources.items()}
+
+# Pre-encoded /api/topology body, versioned by the source files' modification times
+TOPOLOGY_ETAG = hashlib.md5(
+    '|'.join(f"{path}:{os.path.getmtime(path)}" for path in network_sources.values()).encode()
+).hexdigest()
+TOPOLOGY_BODY = app.json.dumps({'success': True, **network_records}).encode()
+TOPOLOGY_BODY_GZIP = gzip.compress(TOPOLOGY_BODY, compresslevel=6)
+TOPOLOGY_ETAG_GZIP = f"{TOPOLOGY_ETAG}-gzip"  # Strong validators differ per content-coding
+
+VALID_SCENARIOS = ['baseline', 'cost_optimized', 'disruption']
 
-# Cache for storing results
-results_cache = {}
+# Static Excel export layout, shared by every export (only the cell values vary per scenario)
+EXCEL_FORMATS = {
+    'title': {'bold': True, 'font_size': 16, 'font_color': '#DB0A40'},
+    'section': {'bold': True, 'font_size': 14},
+    'subtitle': {'bold': True, 'font_size': 12},
+    'header': {'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#0A0A0A', 'pattern': 1, 'align': 'center'}
+}
+EXCEL_SUMMARY_COLUMNS = (('A:A', 25), ('B:B', 15), ('C:C', 25), ('D:D', 60))
+EXCEL_INSIGHTS_COLUMNS = (('A:A', 80), ('B:B', 20))
+EXCEL_KPI_HEADERS = ('Metric', 'Value', 'vs Target', 'Business Impact')
+EXCEL_KPI_SPEC = (  # (label, KPI key, comparison field)
+    ('Total Network Cost', 'total_cost', 'vs_optimal'),
+    ('Fill Rate', 'fill_rate', 'vs_target'),
+    ('Avg Lead Time', 'avg_lead_time', 'vs_competitor'),
+    ('CO2 Emissions', 'co2_emissions', 'vs_target'),
+    ('Cost per Unit', 'cost_per_unit', 'vs_budget')
+)
+
+
+def error_response(e, message):
+    """Log the exception with its traceback and build a 500 response (details only in debug mode)."""
+    app.logger.exception(message)
+    return jsonify({
+        'success': False,
+        'error': str(e) if app.debug else 'Internal server error'
+    }), 500
+
+
+def significant_flows(flows, flow_type, min_volume=1000):
+    """Format solver flows above min_volume for the map (threshold applied in NumPy)."""
+    volumes = np.fromiter(flows.values(), dtype=np.float64, count=len(flows))
+    mask = volumes > min_volume
+    return [
+        {'from': k[0], 'to': k[1], 'volume': v, 'type': flow_type}
+        for k, v in zip(compress(flows.keys(), mask), volumes[mask].tolist())
+    ]
+
+
+def scenario_flows(result):
+    """Significant flows of a cached scenario result for the map ({} if not run yet)."""
+    if result is None:
+        return {}
+    return {
+        'plant_to_dc': significant_flows(result['solution']['plant_to_dc_flows'], 'plant_to_dc'),
+        'dc_to_market': significant_flows(result['solution']['dc_to_market_flows'], 'dc_to_market')
+    }
 
 
 @app.route('/')
@@ -31,6 +161,15 @@ def index():
     return render_template('index.html')
 
 
+@lru_cache(maxsize=1)
+def scenarios_payload():
+    """Encoded /api/scenarios body (scenario definitions are static, so serialize once)."""
+    return app.json.dumps({
+        'success': True,
+        'scenarios': scenario_engine.get_scenario_definitions()
+    })
+
+
 @app.route('/api/scenarios', methods=['GET'])
 def get_scenarios():
     """
@@ -40,16 +179,9 @@ def get_scenarios():
         JSON with scenario definitions including objectives and use cases
     """
     try:
-        scenarios = scenario_engine.get_scenario_definitions()
-        return jsonify({
-            'success': True,
-            'scenarios': scenarios
-        })
+        return Response(scenarios_payload(), mimetype='application/json')
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(e, "Failed to load scenario definitions")
 
 
 @app.route('/api/optimize', methods=['POST'])
@@ -70,47 +202,37 @@ def run_optimization():
         scenario_id = data.get('scenario_id', 'baseline')
         
         # Validate scenario
-        valid_scenarios = ['baseline', 'cost_optimized', 'disruption']
-        if scenario_id not in valid_scenarios:
+        if scenario_id not in VALID_SCENARIOS:
             return jsonify({
                 'success': False,
-                'error': f'Invalid scenario: {scenario_id}. Must be one of {valid_scenarios}'
+                'error': f'Invalid scenario: {scenario_id}. Must be one of {VALID_SCENARIOS}'
             }), 400
         
         # Run optimization
         result = scenario_engine.run_scenario(scenario_id)
         
         # Cache result
-        results_cache[scenario_id] = result
+        cache_result(scenario_id, result)
         
-        # Format response (convert numpy types to native Python)
-        response = {
-            'success': True,
-            'scenario_id': result['scenario_id'],
-            'kpis': result['kpis'],
-            'insights': result['insights'],
-            'comparison': result['comparison'],
-            'solution_summary': {
-                'total_cost': float(result['solution']['objective_value']),
-                'status': result['solution']['status'],
-                'production_by_plant': {
-                    k: float(v) for k, v in result['solution']['production'].items()
-                },
-                'cost_breakdown': {
-                    k: float(v) for k, v in result['solution']['cost_breakdown'].items()
-                }
-            }
-        }
+        # Format response (fixed shape, so encode through the typed msgspec schema)
+        response = OptimizeResponse(
+            success=True,
+            scenario_id=result['scenario_id'],
+            kpis=result['kpis'],
+            insights=result['insights'],
+            comparison=result['comparison'],
+            solution_summary=SolutionSummary(
+                total_cost=result['solution']['objective_value'],
+                status=result['solution']['status'],
+                production_by_plant=result['solution']['production'],
+                cost_breakdown=result['solution']['cost_breakdown']
+            )
+        )
         
-        return jsonify(response)
+        return Response(optimize_encoder.encode(response), mimetype='application/json')
         
     except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(e, "Optimization failed")
 
 
 @app.route('/api/kpis', methods=['GET'])
@@ -123,11 +245,10 @@ def get_kpis():
     """
     try:
         # Get baseline KPIs if not already cached
-        if 'baseline' not in results_cache:
-            result = scenario_engine.run_scenario('baseline')
-            results_cache['baseline'] = result
-        
-        baseline = results_cache['baseline']
+        baseline = get_cached_result('baseline')
+        if baseline is None:
+            baseline = scenario_engine.run_scenario('baseline')
+            cache_result('baseline', baseline)
         
         return jsonify({
             'success': True,
@@ -135,10 +256,7 @@ def get_kpis():
         })
         
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(e, "KPI calculation failed")
 
 
 @app.route('/api/network-data', methods=['GET'])
@@ -150,54 +268,70 @@ def get_network_data():
         JSON with plants, DCs, markets, and flows
     """
     try:
-        import pandas as pd
-        
-        # Load network data
-        plants = pd.read_csv('data/plants.csv')
-        dcs = pd.read_csv('data/distribution_centers.csv')
-        markets = pd.read_csv('data/markets.csv')
-        routes = pd.read_csv('data/transportation.csv')
-        
         # Get baseline flows if available
-        flows = {}
-        if 'baseline' in results_cache:
-            baseline = results_cache['baseline']
-            flows = {
-                'plant_to_dc': [
-                    {
-                        'from': k[0],
-                        'to': k[1],
-                        'volume': float(v),
-                        'type': 'plant_to_dc'
-                    }
-                    for k, v in baseline['solution']['plant_to_dc_flows'].items()
-                    if v > 1000  # Only significant flows
-                ],
-                'dc_to_market': [
-                    {
-                        'from': k[0],
-                        'to': k[1],
-                        'volume': float(v),
-                        'type': 'dc_to_market'
-                    }
-                    for k, v in baseline['solution']['dc_to_market_flows'].items()
-                    if v > 1000
-                ]
-            }
-        
         return jsonify({
             'success': True,
-            'plants': plants.to_dict('records'),
-            'dcs': dcs.to_dict('records'),
-            'markets': markets.to_dict('records'),
-            'flows': flows
+            'plants': network_records['plants'],
+            'dcs': network_records['dcs'],
+            'markets': network_records['markets'],
+            'flows': scenario_flows(get_cached_result('baseline'))
         })
         
     except Exception as e:
+        return error_response(e, "Failed to build network data")
+
+
+@app.route('/api/topology', methods=['GET'])
+def get_topology():
+    """
+    Get static network topology (plants, DCs, markets) for visualization.
+    Served pre-encoded with a strong ETag; repeat loads get 304 Not Modified.
+    
+    Returns:
+        JSON with plants, DCs, and markets
+    """
+    use_gzip = request.accept_encodings['gzip'] > 0  # Honours 'gzip;q=0' refusals and '*'
+    if TOPOLOGY_ETAG in request.if_none_match or TOPOLOGY_ETAG_GZIP in request.if_none_match:
+        response = Response(status=304)
+    elif use_gzip:
+        response = Response(TOPOLOGY_BODY_GZIP, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(TOPOLOGY_BODY, mimetype='application/json')
+    
+    response.set_etag(TOPOLOGY_ETAG_GZIP if use_gzip else TOPOLOGY_ETAG)
+    response.headers['Cache-Control'] = 'public, max-age=86400'
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+@app.route('/api/flows', methods=['GET'])
+def get_flows():
+    """
+    Get optimized network flows for a scenario (empty until the scenario has been run).
+    
+    Query params:
+        scenario: "baseline" | "cost_optimized" | "disruption" (default: baseline)
+    
+    Returns:
+        JSON with plant-to-DC and DC-to-market flows
+    """
+    scenario_id = request.args.get('scenario', 'baseline')
+    if scenario_id not in VALID_SCENARIOS:
         return jsonify({
             'success': False,
-            'error': str(e)
-        }), 500
+            'error': f'Invalid scenario: {scenario_id}. Must be one of {VALID_SCENARIOS}'
+        }), 400
+    
+    try:
+        return jsonify({
+            'success': True,
+            'scenario_id': scenario_id,
+            'flows': scenario_flows(get_cached_result(scenario_id))
+        })
+        
+    except Exception as e:
+        return error_response(e, "Failed to build network flows")
 
 
 @app.route('/api/export-excel', methods=['POST'])
@@ -214,89 +348,62 @@ def export_excel():
         Excel file download
     """
     try:
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, Alignment, PatternFill
-        import io
-        
         data = request.get_json()
         scenario_id = data.get('scenario_id', 'baseline')
         
         # Get scenario result
-        if scenario_id not in results_cache:
+        result = get_cached_result(scenario_id)
+        if result is None:
             result = scenario_engine.run_scenario(scenario_id)
-            results_cache[scenario_id] = result
-        else:
-            result = results_cache[scenario_id]
+            cache_result(scenario_id, result)
         
-        # Create workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Executive Summary"
+        # Create workbook (constant_memory streams each row out once it's complete,
+        # so rows must be written top to bottom)
+        excel_file = io.BytesIO()
+        wb = xlsxwriter.Workbook(excel_file, {'constant_memory': True})
+        formats = {name: wb.add_format(spec) for name, spec in EXCEL_FORMATS.items()}
         
-        # Header
-        ws['A1'] = "Red Bull Global Network Optimizer"
-        ws['A1'].font = Font(bold=True, size=16, color="DB0A40")
-        ws.merge_cells('A1:D1')
+        ws = wb.add_worksheet("Executive Summary")
         
-        ws['A2'] = f"Scenario: {scenario_id.upper()}"
-        ws['A2'].font = Font(bold=True, size=12)
+        # Format columns
+        for columns, width in EXCEL_SUMMARY_COLUMNS:
+            ws.set_column(columns, width)
+        
+        # Header
+        ws.merge_range('A1:D1', "Red Bull Global Network Optimizer", formats['title'])
+        ws.write('A2', f"Scenario: {scenario_id.upper()}", formats['subtitle'])
         
         # KPI table
-        ws['A4'] = "Key Performance Indicators"
-        ws['A4'].font = Font(bold=True, size=14)
+        ws.write('A4', "Key Performance Indicators", formats['section'])
         
         # Headers
-        headers = ['Metric', 'Value', 'vs Target', 'Business Impact']
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=5, column=col)
-            cell.value = header
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="0A0A0A", end_color="0A0A0A", fill_type="solid")
-            cell.alignment = Alignment(horizontal='center')
+        ws.write_row(4, 0, EXCEL_KPI_HEADERS, formats['header'])
         
         # KPI data
         kpis = result['kpis']
-        kpi_rows = [
-            ['Total Network Cost', kpis['total_cost']['formatted'], kpis['total_cost']['vs_optimal'], kpis['total_cost']['impact']],
-            ['Fill Rate', kpis['fill_rate']['formatted'], kpis['fill_rate']['vs_target'], kpis['fill_rate']['impact']],
-            ['Avg Lead Time', kpis['avg_lead_time']['formatted'], kpis['avg_lead_time']['vs_competitor'], kpis['avg_lead_time']['impact']],
-            ['CO2 Emissions', kpis['co2_emissions']['formatted'], kpis['co2_emissions']['vs_target'], kpis['co2_emissions']['impact']],
-            ['Cost per Unit', kpis['cost_per_unit']['formatted'], kpis['cost_per_unit']['vs_budget'], kpis['cost_per_unit']['impact']],
-        ]
-        
-        for row_idx, row_data in enumerate(kpi_rows, start=6):
-            for col_idx, value in enumerate(row_data, start=1):
-                ws.cell(row=row_idx, column=col_idx, value=value)
-        
-        # Format columns
-        ws.column_dimensions['A'].width = 25
-        ws.column_dimensions['B'].width = 15
-        ws.column_dimensions['C'].width = 25
-        ws.column_dimensions['D'].width = 60
+        for row_idx, (label, key, vs_key) in enumerate(EXCEL_KPI_SPEC, start=5):
+            kpi = kpis[key]
+            ws.write_row(row_idx, 0, (label, kpi['formatted'], kpi[vs_key], kpi['impact']))
         
         # Insights sheet
-        ws2 = wb.create_sheet("Strategic Insights")
-        ws2['A1'] = "Strategic Recommendations"
-        ws2['A1'].font = Font(bold=True, size=14)
+        ws2 = wb.add_worksheet("Strategic Insights")
+        for columns, width in EXCEL_INSIGHTS_COLUMNS:
+            ws2.set_column(columns, width)
+        ws2.write('A1', "Strategic Recommendations", formats['section'])
         
-        row = 3
+        row = 2
         for insight in result['insights']:
-            ws2[f'A{row}'] = insight['title']
-            ws2[f'A{row}'].font = Font(bold=True, size=12)
-            ws2[f'B{row}'] = f"Priority: {insight['priority'].upper()}"
+            ws2.write(row, 0, insight['title'], formats['subtitle'])
+            ws2.write(row, 1, f"Priority: {insight['priority'].upper()}")
             
-            ws2[f'A{row+1}'] = insight['description']
-            ws2[f'A{row+2}'] = f"Impact: {insight['impact']}"
-            ws2[f'A{row+3}'] = f"Implementation: {insight['implementation']}"
+            ws2.write(row + 1, 0, insight['description'])
+            ws2.write(row + 2, 0, f"Impact: {insight['impact']}")
+            ws2.write(row + 3, 0, f"Implementation: {insight['implementation']}")
             
             row += 5
         
-        ws2.column_dimensions['A'].width = 80
-        ws2.column_dimensions['B'].width = 20
-        
         # Save to BytesIO
-        excel_file = io.BytesIO()
-        wb.save(excel_file)
+        wb.close()
         excel_file.seek(0)
         
         return send_file(
@@ -307,21 +414,19 @@ def export_excel():
         )
         
     except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(e, "Excel export failed")
+
+
+HEALTH_PAYLOAD = app.json.dumps({
+    'status': 'healthy',
+    'version': '1.0.0'
+})
 
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({
-        'status': 'healthy',
-        'version': '1.0.0'
-    })
+    return Response(HEALTH_PAYLOAD, mimetype='application/json')
 
 
 if __name__ == '__main__':
@@ -329,4 +434,4 @@ if __name__ == '__main__':
     print("📍 Server running at: http://localhost:5000")
     print("📊 API endpoints available at: http://localhost:5000/api/")
     print("\n")
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(debug=Config.DEBUG, host='0.0.0.0', port=5000)
@@ -4,19 +4,30 @@ Configuration settings for Red Bull Network Optimizer
 
 import os
 
+
+def _env_flag(name, default='0'):
+    """Boolean setting from the environment ('1', 'true' or 'yes' enable it)."""
+    return os.environ.get(name, default).strip().lower() in ('1', 'true', 'yes')
+
+
 class Config:
     """Base configuration class."""
     
     # Flask settings
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'red-bull-optimizer-secret-key-2024'
-    DEBUG = True
+    DEBUG = _env_flag('FLASK_DEBUG')  # Off unless FLASK_DEBUG=1 (hides error details, compact JSON)
     
     # Data paths
     DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
     
     # Optimization settings
     OPTIMIZATION_TIME_LIMIT = 30  # seconds
-    SOLVER = 'PULP_CBC_CMD'  # PuLP default solver
+    SOLVER = os.environ.get('SOLVER', 'highs')  # 'highs', 'cbc' or 'gurobi'
+    WARM_BASELINE = _env_flag('WARM_BASELINE', '1')  # Solve the baseline in the background at startup
+    
+    # Results cache settings
+    RESULTS_CACHE_SIZE = 16  # max cached scenario results
+    RESULTS_CACHE_TTL = 3600  # seconds
     
     # Network parameters
     UNMET_DEMAND_PENALTY = 5.0  # EUR per unit (reflects lost revenue + brand damage)
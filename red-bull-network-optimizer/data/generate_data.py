@@ -6,26 +6,81 @@ and industry-standard logistics parameters.
 
 import pandas as pd
 import numpy as np
-from math import radians, cos, sin, asin, sqrt
+
+# Explicit column dtypes (compact numerics, categorical low-cardinality labels).
+# Per-unit EUR rates, coordinates and multipliers stay float64 so they round-trip
+# exactly through Parquet.
+PLANTS_DTYPES = {
+    'country': 'category',
+    'latitude': 'float64',
+    'longitude': 'float64',
+    'capacity_annual_millions': 'int32',
+    'cost_per_unit_eur': 'float64'
+}
+
+DCS_DTYPES = {
+    'country': 'category',
+    'region': 'category',
+    'latitude': 'float64',
+    'longitude': 'float64',
+    'storage_capacity_millions': 'int32',
+    'fixed_cost_monthly_eur': 'int32',
+    'variable_cost_per_unit_eur': 'float64'
+}
+
+MARKETS_DTYPES = {
+    'country': 'category',
+    'market_maturity': 'category',
+    'latitude': 'float64',
+    'longitude': 'float64',
+    'annual_demand_millions': 'int32',
+    'revenue_per_unit_eur': 'float64',
+    'seasonality_summer_multiplier': 'float64'
+}
 
 def haversine_distance(lat1, lon1, lat2, lon2):
     """
     Calculate the great circle distance between two points on earth (in kilometers).
+    Accepts scalars or NumPy arrays (broadcast element-wise).
     """
     # Convert decimal degrees to radians
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+    lat1, lon1, lat2, lon2 = map(np.deg2rad, [lat1, lon1, lat2, lon2])
     
     # Haversine formula
     dlat = lat2 - lat1
     dlon = lon2 - lon1
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * asin(sqrt(a))
+    a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
+    c = 2 * np.arcsin(np.sqrt(a))
     km = 6371 * c
     return km
 
+def haversine_matrix(lat_a, lon_a, lat_b, lon_b):
+    """
+    Calculate great circle distances (in kilometers) between every point in A and every point in B.
+    Takes 1-D arrays of decimal degrees and returns an (len(A), len(B)) distance matrix.
+    """
+    # Broadcast A as a column and B as a row
+    lat_a = np.asarray(lat_a, dtype=np.float64).reshape(-1, 1)
+    lon_a = np.asarray(lon_a, dtype=np.float64).reshape(-1, 1)
+    lat_b = np.asarray(lat_b, dtype=np.float64).reshape(1, -1)
+    lon_b = np.asarray(lon_b, dtype=np.float64).reshape(1, -1)
+    
+    return haversine_distance(lat_a, lon_a, lat_b, lon_b)
+
+def typed_frame(rows, dtypes):
+    """
+    Build a frame column by column from row dicts, creating declared columns directly
+    in their dtype (no per-column inference followed by a second astype pass).
+    Undeclared columns (IDs, names, free text) are inferred as usual.
+    """
+    return pd.DataFrame({
+        column: pd.Series([row[column] for row in rows], dtype=dtypes.get(column))
+        for column in rows[0]
+    })
+
 def generate_plants():
     """Generate 4 manufacturing plants with realistic Red Bull locations."""
-    plants = pd.DataFrame([
+    plants = typed_frame([
         {
             'plant_id': 'P1',
             'name': 'Red Bull Headquarters Plant',
@@ -70,13 +125,13 @@ def generate_plants():
             'cost_per_unit_eur': 0.19,
             'notes': 'Serves Asian markets'
         }
-    ])
+    ], PLANTS_DTYPES)
     
     return plants
 
 def generate_distribution_centers():
     """Generate 12 strategic global distribution centers."""
-    dcs = pd.DataFrame([
+    dcs = typed_frame([
         {'dc_id': 'DC1', 'name': 'European Hub', 'city': 'Vienna', 'country': 'Austria', 'latitude': 48.2082, 'longitude': 16.3738, 'storage_capacity_millions': 50, 'fixed_cost_monthly_eur': 180000, 'variable_cost_per_unit_eur': 0.03, 'region': 'Europe'},
         {'dc_id': 'DC2', 'name': 'UK & Ireland Hub', 'city': 'London', 'country': 'UK', 'latitude': 51.5074, 'longitude': -0.1278, 'storage_capacity_millions': 35, 'fixed_cost_monthly_eur': 220000, 'variable_cost_per_unit_eur': 0.04, 'region': 'Europe'},
         {'dc_id': 'DC3', 'name': 'Western Europe Hub', 'city': 'Paris', 'country': 'France', 'latitude': 48.8566, 'longitude': 2.3522, 'storage_capacity_millions': 40, 'fixed_cost_monthly_eur': 200000, 'variable_cost_per_unit_eur': 0.035, 'region': 'Europe'},
@@ -89,13 +144,13 @@ def generate_distribution_centers():
         {'dc_id': 'DC10', 'name': 'MENA Hub', 'city': 'Dubai', 'country': 'UAE', 'latitude': 25.2048, 'longitude': 55.2708, 'storage_capacity_millions': 25, 'fixed_cost_monthly_eur': 170000, 'variable_cost_per_unit_eur': 0.035, 'region': 'MENA'},
         {'dc_id': 'DC11', 'name': 'Africa Hub', 'city': 'Johannesburg', 'country': 'South Africa', 'latitude': -26.2041, 'longitude': 28.0473, 'storage_capacity_millions': 15, 'fixed_cost_monthly_eur': 130000, 'variable_cost_per_unit_eur': 0.03, 'region': 'Africa'},
         {'dc_id': 'DC12', 'name': 'Eastern Europe Hub', 'city': 'Moscow', 'country': 'Russia', 'latitude': 55.7558, 'longitude': 37.6173, 'storage_capacity_millions': 25, 'fixed_cost_monthly_eur': 160000, 'variable_cost_per_unit_eur': 0.032, 'region': 'Europe'}
-    ])
+    ], DCS_DTYPES)
     
     return dcs
 
 def generate_markets():
     """Generate 25 aggregated demand regions with realistic volumes."""
-    markets = pd.DataFrame([
+    markets = typed_frame([
         {'market_id': 'M1', 'name': 'United States', 'country': 'USA', 'latitude': 37.0902, 'longitude': -95.7129, 'annual_demand_millions': 350, 'revenue_per_unit_eur': 2.80, 'seasonality_summer_multiplier': 1.3, 'market_maturity': 'Mature'},
         {'market_id': 'M2', 'name': 'Germany', 'country': 'Germany', 'latitude': 51.1657, 'longitude': 10.4515, 'annual_demand_millions': 85, 'revenue_per_unit_eur': 2.65, 'seasonality_summer_multiplier': 1.2, 'market_maturity': 'Mature'},
         {'market_id': 'M3', 'name': 'United Kingdom', 'country': 'UK', 'latitude': 55.3781, 'longitude': -3.4360, 'annual_demand_millions': 65, 'revenue_per_unit_eur': 2.70, 'seasonality_summer_multiplier': 1.15, 'market_maturity': 'Mature'},
@@ -121,7 +176,7 @@ def generate_markets():
         {'market_id': 'M23', 'name': 'Indonesia', 'country': 'Indonesia', 'latitude': -0.7893, 'longitude': 113.9213, 'annual_demand_millions': 17, 'revenue_per_unit_eur': 2.28, 'seasonality_summer_multiplier': 1.08, 'market_maturity': 'High-Growth'},
         {'market_id': 'M24', 'name': 'Argentina', 'country': 'Argentina', 'latitude': -38.4161, 'longitude': -63.6167, 'annual_demand_millions': 15, 'revenue_per_unit_eur': 2.35, 'seasonality_summer_multiplier': 1.12, 'market_maturity': 'Growth'},
         {'market_id': 'M25', 'name': 'Sweden', 'country': 'Sweden', 'latitude': 60.1282, 'longitude': 18.6435, 'annual_demand_millions': 16, 'revenue_per_unit_eur': 2.78, 'seasonality_summer_multiplier': 1.2, 'market_maturity': 'Mature'}
-    ])
+    ], MARKETS_DTYPES)
     
     return markets
 
@@ -129,11 +184,26 @@ def generate_transportation_routes(plants, dcs, markets):
     """Generate realistic transportation routes with costs based on distance and mode."""
     routes = []
     
+    # Pull IDs out as plain arrays up front (avoids per-row Series boxing)
+    plant_ids = plants['plant_id'].to_numpy()
+    dc_ids = dcs['dc_id'].to_numpy()
+    market_ids = markets['market_id'].to_numpy()
+    
+    # Distance matrices for all plant-DC and market-DC pairs (computed once)
+    plant_dc_km = haversine_matrix(plants['latitude'].to_numpy(), plants['longitude'].to_numpy(),
+                                   dcs['latitude'].to_numpy(), dcs['longitude'].to_numpy())
+    market_dc_km = haversine_matrix(markets['latitude'].to_numpy(), markets['longitude'].to_numpy(),
+                                    dcs['latitude'].to_numpy(), dcs['longitude'].to_numpy())
+    
+    # Realistic cost variance for every route, drawn in one batch per route type
+    rng = np.random.default_rng(42)
+    plant_dc_variance = rng.uniform(0.95, 1.05, size=plant_dc_km.shape)
+    market_dc_variance = rng.uniform(0.95, 1.05, size=(len(markets), 3))
+    
     # Plant to DC routes
-    for _, plant in plants.iterrows():
-        for _, dc in dcs.iterrows():
-            distance = haversine_distance(plant['latitude'], plant['longitude'], 
-                                         dc['latitude'], dc['longitude'])
+    for i, plant_id in enumerate(plant_ids):
+        for j, dc_id in enumerate(dc_ids):
+            distance = plant_dc_km[i, j]
             
             # Determine transport mode based on distance
             if distance < 500:
@@ -153,12 +223,11 @@ def generate_transportation_routes(plants, dcs, markets):
                 co2_per_unit = 0.08
             
             # Add realistic variance
-            cost_variance = np.random.uniform(0.95, 1.05)
-            cost_per_unit *= cost_variance
+            cost_per_unit *= plant_dc_variance[i, j]
             
             routes.append({
-                'from_id': plant['plant_id'],
-                'to_id': dc['dc_id'],
+                'from_id': plant_id,
+                'to_id': dc_id,
                 'from_type': 'plant',
                 'to_type': 'dc',
                 'distance_km': round(distance, 1),
@@ -170,19 +239,17 @@ def generate_transportation_routes(plants, dcs, markets):
             })
     
     # DC to Market routes (assign each market to nearest 2-3 DCs for redundancy)
-    for _, market in markets.iterrows():
-        # Calculate distances to all DCs
-        dc_distances = []
-        for _, dc in dcs.iterrows():
-            distance = haversine_distance(market['latitude'], market['longitude'],
-                                         dc['latitude'], dc['longitude'])
-            dc_distances.append((dc['dc_id'], distance))
-        
-        # Sort by distance and take nearest 2-3
-        dc_distances.sort(key=lambda x: x[1])
-        nearest_dcs = dc_distances[:3]
+    # Partial selection of the 3 nearest DCs per market, then order those 3 by distance
+    nearest_idx = np.argpartition(market_dc_km, 2, axis=1)[:, :3]
+    nearest_km = np.take_along_axis(market_dc_km, nearest_idx, axis=1)
+    order = np.argsort(nearest_km, axis=1)
+    nearest_idx = np.take_along_axis(nearest_idx, order, axis=1)
+    nearest_km = np.take_along_axis(nearest_km, order, axis=1)
+    
+    for i, market_id in enumerate(market_ids):
+        nearest_dcs = zip(dc_ids[nearest_idx[i]], nearest_km[i])
         
-        for dc_id, distance in nearest_dcs:
+        for k, (dc_id, distance) in enumerate(nearest_dcs):
             if distance < 300:
                 mode = 'road'
                 cost_per_unit = 0.01
@@ -200,12 +267,11 @@ def generate_transportation_routes(plants, dcs, markets):
                 co2_per_unit = 0.05
             
             # Add variance
-            cost_variance = np.random.uniform(0.95, 1.05)
-            cost_per_unit *= cost_variance
+            cost_per_unit *= market_dc_variance[i, k]
             
             routes.append({
                 'from_id': dc_id,
-                'to_id': market['market_id'],
+                'to_id': market_id,
                 'from_type': 'dc',
                 'to_type': 'market',
                 'distance_km': round(distance, 1),
@@ -228,11 +294,16 @@ def main():
     markets = generate_markets()
     routes = generate_transportation_routes(plants, dcs, markets)
     
-    # Save to CSV
-    plants.to_csv('data/plants.csv', index=False)
-    dcs.to_csv('data/distribution_centers.csv', index=False)
-    markets.to_csv('data/markets.csv', index=False)
-    routes.to_csv('data/transportation.csv', index=False)
+    # Save to CSV (human-readable) and Parquet (typed, fast to load)
+    tables = {
+        'plants': plants,
+        'distribution_centers': dcs,
+        'markets': markets,
+        'transportation': routes
+    }
+    for name, df in tables.items():
+        df.to_csv(f'data/{name}.csv', index=False)
+        df.to_parquet(f'data/{name}.parquet', engine='pyarrow', compression='snappy', index=False)
     
     # Print summary
     print(f"\n✅ Data generation complete!")
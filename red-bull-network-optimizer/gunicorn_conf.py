@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration for Red Bull Network Optimizer
+Production server: gunicorn -c gunicorn_conf.py app:app (Linux/macOS)
+"""
+
+import multiprocessing
+import os
+
+# Run from the project root so relative data paths ('data/...') resolve
+chdir = os.path.dirname(os.path.abspath(__file__))
+
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+
+# Multiple workers so a long CBC solve in one process doesn't block the others
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+
+# gevent keeps /api/kpis, /api/network-data and /health responsive during a solve;
+# the in-process HiGHS solve holds the worker only for milliseconds, and the CBC
+# fallback (solver='cbc') yields while its subprocess runs
+worker_class = 'gevent'
+worker_connections = 100
+
+# Solver time limit is 30s; leave headroom for KPI calculation and the first cold solve
+timeout = 90
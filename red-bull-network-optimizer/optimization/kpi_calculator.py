@@ -5,7 +5,31 @@ Transforms optimization results into actionable business insights.
 
 import pandas as pd
 import numpy as np
-from typing import Dict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+try:
+    from .network_model import load_network
+except ImportError:  # Run as a script from optimization/
+    from network_model import load_network
+
+
+def _weighted_sum(volumes: np.ndarray, coefs: np.ndarray) -> float:
+    """Multiply-accumulate kernel shared by the CO2 and lead-time KPIs."""
+    return float(np.dot(volumes, coefs))
+
+
+@dataclass
+class SolutionStats:
+    """Aggregates of a solution shared by the KPI helpers (computed in one pass)."""
+    total_production: float
+    max_plant_share: float
+    active_dcs: int
+    total_unmet: float
+    worst_market: Optional[Tuple[str, float]]
+    cost_total: float
+    cost_shares: Dict[str, float]
+
 
 class KPICalculator:
     """
@@ -18,10 +42,17 @@ class KPICalculator:
     def __init__(self, data_dir='data'):
         """Initialize with network data."""
         self.data_dir = data_dir
-        self.plants = pd.read_csv(f'{data_dir}/plants.csv')
-        self.dcs = pd.read_csv(f'{data_dir}/distribution_centers.csv')
-        self.markets = pd.read_csv(f'{data_dir}/markets.csv')
-        self.routes = pd.read_csv(f'{data_dir}/transportation.csv')
+        tables = load_network(data_dir)
+        self.plants = tables['plants']
+        self.dcs = tables['dcs']
+        self.markets = tables['markets']
+        self.routes = tables['routes']
+        
+        # Routes indexed by (from_id, to_id) so a whole flow dict resolves to row positions
+        # with one hashed get_indexer call
+        self.routes_idx = self.routes.set_index(['from_id', 'to_id']).sort_index()
+        
+        self.total_demand = sum(self.markets['annual_demand_millions']) * 1e6
         
     def calculate_kpis(self, solution: Dict, scenario_name: str) -> Dict:
         """
@@ -34,11 +65,11 @@ class KPICalculator:
         Returns:
             Dictionary of KPIs with context, impact, and actions
         """
-        total_demand = sum(self.markets['annual_demand_millions']) * 1e6
-        total_capacity = sum(self.plants['capacity_annual_millions']) * 1e6
+        total_demand = self.total_demand
+        stats = self._compute_summary(solution)
         
         # Calculate fill rate
-        total_unmet = sum(solution['unmet_demand'].values())
+        total_unmet = stats.total_unmet
         fill_rate = ((total_demand - total_unmet) / total_demand) * 100
         
         # Calculate average lead time (weighted by volume)
@@ -53,7 +84,7 @@ class KPICalculator:
         cost_per_unit = total_cost / units_delivered if units_delivered > 0 else 0
         
         # Calculate resilience score
-        resilience_score = self._calculate_resilience_score(solution)
+        resilience_score = self._calculate_resilience_score(stats)
         
         # Build KPIs with business context
         kpis = {
@@ -64,7 +95,7 @@ class KPICalculator:
                 "vs_optimal": self._get_vs_optimal(total_cost, scenario_name),
                 "context": self._get_cost_context(total_cost, scenario_name),
                 "impact": self._get_cost_impact(total_cost, solution, scenario_name),
-                "driver": self._get_cost_driver(solution),
+                "driver": self._get_cost_driver(stats),
                 "action": self._get_cost_action(solution, scenario_name)
             },
             
@@ -75,7 +106,7 @@ class KPICalculator:
                 "vs_target": f"{fill_rate - 100:.1f}pp vs 100% target",
                 "context": f"Missing {(100-fill_rate):.1f}% of demand = {total_unmet/1e6:.0f}M units unfulfilled annually",
                 "impact": self._get_fillrate_impact(fill_rate, total_unmet),
-                "driver": self._get_fillrate_driver(solution, scenario_name),
+                "driver": self._get_fillrate_driver(stats, scenario_name),
                 "action": self._get_fillrate_action(fill_rate, scenario_name)
             },
             
@@ -119,58 +150,69 @@ class KPICalculator:
                 "vs_benchmark": f"{resilience_score - 80:.0f} points vs industry best practice (80/100)",
                 "context": self._get_resilience_context(resilience_score, scenario_name),
                 "impact": "One major plant outage = €47M quarterly loss (2021 precedent)",
-                "driver": self._get_resilience_driver(solution, scenario_name),
+                "driver": self._get_resilience_driver(stats, scenario_name),
                 "action": "Dual-sourcing strategy for top 10 markets + €12M resilience investment"
             }
         }
         
         return kpis
     
+    def _compute_summary(self, solution: Dict) -> SolutionStats:
+        """Reduce the solution dicts once into the aggregates the KPI helpers need."""
+        production = np.fromiter(solution['production'].values(), dtype=np.float64,
+                                 count=len(solution['production']))
+        total_production = float(production.sum())
+        max_plant_share = float(production.max()) / total_production if total_production > 0 else 0.0
+        
+        dc_flows = solution['dc_to_market_flows']
+        active_dcs = int(np.count_nonzero(
+            np.fromiter(dc_flows.values(), dtype=np.float64, count=len(dc_flows)) > 0
+        ))
+        
+        unmet = solution['unmet_demand']
+        total_unmet = float(np.fromiter(unmet.values(), dtype=np.float64, count=len(unmet)).sum())
+        worst_market = max(unmet.items(), key=lambda x: x[1]) if unmet else None
+        
+        breakdown = solution['cost_breakdown']
+        cost_total = sum(breakdown.values())
+        cost_shares = {bucket: cost / cost_total for bucket, cost in breakdown.items()}
+        
+        return SolutionStats(
+            total_production=total_production,
+            max_plant_share=max_plant_share,
+            active_dcs=active_dcs,
+            total_unmet=total_unmet,
+            worst_market=worst_market,
+            cost_total=cost_total,
+            cost_shares=cost_shares
+        )
+    
+    def _flow_arrays(self, flows: Dict, attribute: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Positive flows on known routes, paired with a per-unit route attribute."""
+        if not flows:
+            return np.empty(0), np.empty(0)
+        positions = self.routes_idx.index.get_indexer(pd.MultiIndex.from_tuples(list(flows.keys())))
+        volumes = np.fromiter(flows.values(), dtype=np.float64, count=len(flows))
+        keep = (positions >= 0) & (volumes > 0)
+        coefs = self.routes_idx[attribute].to_numpy(dtype=np.float64)[positions[keep]]
+        return volumes[keep], coefs
+    
     def _calculate_weighted_lead_time(self, solution: Dict) -> float:
         """Calculate volume-weighted average lead time."""
-        total_volume = 0
-        total_weighted_time = 0
+        volumes, lead_times = self._flow_arrays(solution['dc_to_market_flows'], 'lead_time_days')
+        total_volume = float(volumes.sum())
         
-        for (dc_id, market_id), flow in solution['dc_to_market_flows'].items():
-            if flow > 0:
-                route = self.routes[
-                    (self.routes['from_id'] == dc_id) & 
-                    (self.routes['to_id'] == market_id)
-                ]
-                if not route.empty:
-                    lead_time = route.iloc[0]['lead_time_days']
-                    total_volume += flow
-                    total_weighted_time += flow * lead_time
-        
-        return total_weighted_time / total_volume if total_volume > 0 else 0
+        return _weighted_sum(volumes, lead_times) / total_volume if total_volume > 0 else 0
     
     def _calculate_co2_emissions(self, solution: Dict) -> float:
         """Calculate total CO2 emissions from transportation."""
-        total_co2 = 0
-        
-        # Plant to DC emissions
-        for (plant_id, dc_id), flow in solution['plant_to_dc_flows'].items():
-            route = self.routes[
-                (self.routes['from_id'] == plant_id) & 
-                (self.routes['to_id'] == dc_id)
-            ]
-            if not route.empty:
-                co2_per_unit = route.iloc[0]['co2_per_unit_kg']
-                total_co2 += flow * co2_per_unit
-        
-        # DC to Market emissions
-        for (dc_id, market_id), flow in solution['dc_to_market_flows'].items():
-            route = self.routes[
-                (self.routes['from_id'] == dc_id) & 
-                (self.routes['to_id'] == market_id)
-            ]
-            if not route.empty:
-                co2_per_unit = route.iloc[0]['co2_per_unit_kg']
-                total_co2 += flow * co2_per_unit
-        
-        return total_co2
+        # Plant to DC + DC to Market emissions
+        return sum(
+            _weighted_sum(*self._flow_arrays(flows, 'co2_per_unit_kg'))
+            for flows in (solution['plant_to_dc_flows'], solution['dc_to_market_flows'])
+        )
     
-    def _calculate_resilience_score(self, solution: Dict) -> int:
+    def _calculate_resilience_score(self, stats: SolutionStats) -> int:
         """
         Calculate network resilience score (0-100).
         Based on: capacity distribution, geographic diversity, backup options
@@ -178,23 +220,18 @@ class KPICalculator:
         score = 100
         
         # Check for over-concentration at single plant
-        total_production = sum(solution['production'].values())
-        if total_production > 0:
-            max_plant_share = max(solution['production'].values()) / total_production
-            if max_plant_share > 0.40:
+        if stats.total_production > 0:
+            if stats.max_plant_share > 0.40:
                 score -= 20  # High dependency on single plant
-            elif max_plant_share > 0.35:
+            elif stats.max_plant_share > 0.35:
                 score -= 10
         
         # Check for geographic diversity of DCs
-        active_dcs = len([f for f in solution['dc_to_market_flows'].values() if f > 0])
-        if active_dcs < 8:
+        if stats.active_dcs < 8:
             score -= 15  # Limited geographic coverage
         
         # Check for unmet demand (indicates capacity strain)
-        total_unmet = sum(solution['unmet_demand'].values())
-        total_demand = sum(self.markets['annual_demand_millions']) * 1e6
-        unmet_pct = (total_unmet / total_demand) * 100
+        unmet_pct = (stats.total_unmet / self.total_demand) * 100
         if unmet_pct > 10:
             score -= 20  # Severe capacity constraints
         elif unmet_pct > 5:
@@ -238,18 +275,17 @@ class KPICalculator:
             increase = cost - 338.7e6
             return f"€{increase/1e6:.1f}M cost increase during disruption = {(increase/1e9):.1f}% of quarterly revenue at risk"
     
-    def _get_cost_driver(self, solution: Dict) -> str:
+    def _get_cost_driver(self, stats: SolutionStats) -> str:
         """Identify main cost driver."""
-        breakdown = solution['cost_breakdown']
-        total = sum(breakdown.values())
+        shares = stats.cost_shares
         
         drivers = []
-        if breakdown['transport_plant_dc'] / total > 0.30:
-            drivers.append(f"Plant-DC transport ({breakdown['transport_plant_dc']/total*100:.0f}%)")
-        if breakdown['warehousing'] / total > 0.25:
-            drivers.append(f"Warehousing ({breakdown['warehousing']/total*100:.0f}%)")
-        if breakdown['production'] / total > 0.25:
-            drivers.append(f"Production ({breakdown['production']/total*100:.0f}%)")
+        if shares['transport_plant_dc'] > 0.30:
+            drivers.append(f"Plant-DC transport ({shares['transport_plant_dc']*100:.0f}%)")
+        if shares['warehousing'] > 0.25:
+            drivers.append(f"Warehousing ({shares['warehousing']*100:.0f}%)")
+        if shares['production'] > 0.25:
+            drivers.append(f"Production ({shares['production']*100:.0f}%)")
         
         return ", ".join(drivers) if drivers else "Balanced cost distribution"
     
@@ -267,16 +303,14 @@ class KPICalculator:
         lost_revenue = (unmet / 1e6) * 2.65  # Average revenue per unit
         return f"€{lost_revenue:.0f}M lost revenue + unmeasured brand damage from stockouts"
     
-    def _get_fillrate_driver(self, solution: Dict, scenario: str) -> str:
+    def _get_fillrate_driver(self, stats: SolutionStats, scenario: str) -> str:
         """Identify fill rate constraint driver."""
         if scenario == 'disruption':
             return "Austria plant shutdown eliminating 40% of production capacity"
         else:
-            # Find markets with highest unmet demand
-            unmet = solution['unmet_demand']
-            if unmet:
-                worst_market = max(unmet.items(), key=lambda x: x[1])
-                return f"Capacity constraints in specific markets (e.g., {worst_market[0]})"
+            # Market with highest unmet demand
+            if stats.worst_market is not None:
+                return f"Capacity constraints in specific markets (e.g., {stats.worst_market[0]})"
             else:
                 return "No significant capacity constraints"
     
@@ -300,16 +334,14 @@ class KPICalculator:
         else:
             return "Low resilience - high risk of severe disruption impact"
     
-    def _get_resilience_driver(self, solution: Dict, scenario: str) -> str:
+    def _get_resilience_driver(self, stats: SolutionStats, scenario: str) -> str:
         """Identify resilience constraint."""
         if scenario == 'disruption':
             return "Single point of failure demonstrated (Austria = 40% capacity)"
         else:
-            total_prod = sum(solution['production'].values())
-            if total_prod > 0:
-                max_share = max(solution['production'].values()) / total_prod
-                if max_share > 0.40:
-                    return f"Over-concentration at single plant ({max_share*100:.0f}% of production)"
+            if stats.total_production > 0:
+                if stats.max_plant_share > 0.40:
+                    return f"Over-concentration at single plant ({stats.max_plant_share*100:.0f}% of production)"
             return "Distributed production with backup options available"
 
 
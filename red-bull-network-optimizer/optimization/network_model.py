@@ -4,9 +4,90 @@ Uses linear programming to minimize total network cost while meeting demand cons
 """
 
 import pulp
+import highspy
+import numpy as np
 import pandas as pd
-from typing import Dict, Tuple
+from scipy.sparse import coo_matrix
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain, compress
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import json
+import logging
 import os
+import pickle
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+
+def _var_values(variables: Dict) -> np.ndarray:
+    """Read the solved values of a dict of PuLP variables into one float array."""
+    return np.fromiter(
+        (var.varValue or 0.0 for var in variables.values()),
+        dtype=np.float64, count=len(variables)
+    )
+
+
+def _significant_values(variables: Dict, values: np.ndarray, threshold: float = 0.1) -> Dict:
+    """Solved values above threshold, keyed like the variable dict."""
+    keep = values > threshold
+    return dict(zip(compress(variables.keys(), keep), values[keep].tolist()))
+
+
+# Columns read by the optimizer and KPI calculator, with explicit dtypes so pandas skips
+# inference. IDs are strings; rates and route attributes stay float64 so LP costs and
+# KPI totals carry no float32 rounding noise.
+NETWORK_TABLES = {
+    'plants': ('plants.csv', {
+        'plant_id': 'string',
+        'capacity_annual_millions': 'int32',
+        'cost_per_unit_eur': 'float64',
+    }),
+    'dcs': ('distribution_centers.csv', {
+        'dc_id': 'string',
+        'fixed_cost_monthly_eur': 'int32',
+        'variable_cost_per_unit_eur': 'float64',
+    }),
+    'markets': ('markets.csv', {
+        'market_id': 'string',
+        'annual_demand_millions': 'int32',
+    }),
+    'routes': ('transportation.csv', {
+        'from_id': 'string',
+        'to_id': 'string',
+        'from_type': 'category',
+        'cost_per_unit_eur': 'float64',
+        'lead_time_days': 'float64',
+        'co2_per_unit_kg': 'float64',
+    }),
+}
+
+
+def load_network(data_dir: str) -> Dict[str, pd.DataFrame]:
+    """
+    Network tables for data_dir, restricted to the columns the models use.
+    Parsed once per process and shared between NetworkOptimizer and KPICalculator
+    (treat the frames as read-only); file mtimes are part of the cache key so
+    regenerated data is picked up.
+    """
+    stamp = tuple(
+        os.path.getmtime(os.path.join(data_dir, filename))
+        for filename, _ in NETWORK_TABLES.values()
+    )
+    return _load_network(data_dir, stamp)
+
+
+@lru_cache(maxsize=4)
+def _load_network(data_dir: str, stamp: Tuple[float, ...]) -> Dict[str, pd.DataFrame]:
+    """Read the network tables from disk (cached by load_network)."""
+    return {
+        name: pd.read_csv(os.path.join(data_dir, filename), usecols=list(dtypes), dtype=dtypes)
+        for name, (filename, dtypes) in NETWORK_TABLES.items()
+    }
+
 
 class NetworkOptimizer:
     """
@@ -16,18 +97,77 @@ class NetworkOptimizer:
     Constraints: Capacity limits, flow conservation, demand fulfillment
     """
     
-    def __init__(self, data_dir='data'):
-        """Initialize optimizer with network data."""
+    DATA_FILES = tuple(filename for filename, _ in NETWORK_TABLES.values())
+    
+    # Unmet demand penalty (€5 per unit = lost revenue + brand damage)
+    UNMET_PENALTY = 5.0
+    
+    # Bump whenever the LP formulation changes so persisted solutions are invalidated
+    MODEL_VERSION = 1
+    
+    # Supported backends ('cbc' and 'gurobi' solve the shared PuLP model)
+    SOLVERS = ('highs', 'cbc', 'gurobi')
+    
+    def __init__(self, data_dir='data', solver='highs', cache_dir: Optional[str] = None):
+        """
+        Initialize optimizer with network data.
+        
+        Args:
+            data_dir: Directory containing the network CSV files
+            solver: 'highs' (in-process HiGHS via highspy), 'cbc' (PuLP + CBC fallback)
+                or 'gurobi' (PuLP + Gurobi, falling back to CBC when Gurobi is unavailable)
+            cache_dir: Directory for persisted solutions (defaults to <data_dir>/.cache)
+        """
+        if solver not in self.SOLVERS:
+            raise ValueError(f"Unknown solver: {solver}")
         self.data_dir = data_dir
+        self.solver = solver
+        self.cache_dir = cache_dir or os.path.join(data_dir, '.cache')
+        
+        # Guards the persistent solver models shared by all scenarios
+        self._model_lock = Lock()
         self.load_data()
         
     def load_data(self):
         """Load network data from CSV files."""
-        self.plants = pd.read_csv(os.path.join(self.data_dir, 'plants.csv'))
-        self.dcs = pd.read_csv(os.path.join(self.data_dir, 'distribution_centers.csv'))
-        self.markets = pd.read_csv(os.path.join(self.data_dir, 'markets.csv'))
-        self.routes = pd.read_csv(os.path.join(self.data_dir, 'transportation.csv'))
+        # Hash the raw CSV bytes so cached solutions are invalidated when the data changes
+        digest = hashlib.blake2b(digest_size=16)
+        for name in self.DATA_FILES:
+            with open(os.path.join(self.data_dir, name), 'rb') as f:
+                digest.update(f.read())
+        self.data_hash = digest.hexdigest()
+        
+        tables = load_network(self.data_dir)
+        self.plants = tables['plants']
+        self.dcs = tables['dcs']
+        self.markets = tables['markets']
+        self.routes = tables['routes']
+        
+        # Split routes by echelon once (model building reuses these on every solve)
+        self.plant_routes = self.routes[self.routes['from_type'] == 'plant'].reset_index(drop=True)
+        self.dc_routes = self.routes[self.routes['from_type'] == 'dc'].reset_index(drop=True)
+        
+        # Adjacency lists over existing edges only (the route graph is sparse)
+        self.plant_out = defaultdict(list)  # plant_id -> [dc_id]
+        self.dc_in = defaultdict(list)  # dc_id -> [plant_id]
+        for plant_id, dc_id in zip(self.plant_routes['from_id'], self.plant_routes['to_id']):
+            self.plant_out[plant_id].append(dc_id)
+            self.dc_in[dc_id].append(plant_id)
         
+        self.dc_out = defaultdict(list)  # dc_id -> [market_id]
+        self.market_in = defaultdict(list)  # market_id -> [dc_id]
+        for dc_id, market_id in zip(self.dc_routes['from_id'], self.dc_routes['to_id']):
+            self.dc_out[dc_id].append(market_id)
+            self.market_in[market_id].append(dc_id)
+        
+        # Solver models are built on first solve and reused by every scenario
+        self._highs = None
+        self._pulp_model = None
+        
+    def data_fingerprint(self) -> str:
+        """Hash of the loaded network data (changes whenever the CSVs change)."""
+        return self.data_hash
+    
     def optimize_baseline(self) -> Dict:
         """
         Baseline scenario: Current network configuration.
@@ -49,6 +189,10 @@ class NetworkOptimizer:
         """
         Disruption scenario: Austria plant (P1) completely offline.
         Tests network resilience and identifies backup capacity requirements.
+
+        On the HiGHS backend this re-solve is warm-started from the baseline basis:
+        zeroing P1's capacity only tightens row bounds, so the basis stays dual
+        feasible and dual simplex repairs it in a few pivots.
         """
         return self._run_optimization(
             scenario_name="disruption",
@@ -57,7 +201,157 @@ class NetworkOptimizer:
     
     def _run_optimization(self, scenario_name: str, constraints: Dict) -> Dict:
         """
-        Core optimization engine using PuLP.
+        Core optimization engine; dispatches to the configured solver backend.
+        
+        Args:
+            scenario_name: Identifier for the scenario
+            constraints: Additional constraints (disabled plants, min fill rate, etc.)
+            
+        Returns:
+            Dictionary containing solution, costs, flows, and KPIs
+        """
+        # Solutions are a pure function of the data, the model, the constraints and the backend
+        key_fields = [self.MODEL_VERSION, self.UNMET_PENALTY, self.solver, constraints]
+        key = hashlib.blake2b(
+            (self.data_hash + json.dumps(key_fields, sort_keys=True)).encode(),
+            digest_size=16
+        ).hexdigest()
+        cache_path = os.path.join(self.cache_dir, f"{scenario_name}_{key}.pkl")
+        
+        solution = self._load_cached(cache_path)
+        if solution is not None:
+            return solution
+        
+        if self.solver == 'highs':
+            solution = self._solve_highs(scenario_name, constraints)
+        else:
+            solution = self._solve_pulp(scenario_name, constraints)
+        
+        self._store_cached(cache_path, solution)
+        return solution
+    
+    def _load_cached(self, cache_path: str) -> Optional[Dict]:
+        """Persisted solution at cache_path, or None if missing or unreadable (re-solve instead)."""
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            logger.warning("Ignoring unreadable cached solution %s", cache_path, exc_info=True)
+            return None
+    
+    def _store_cached(self, cache_path: str, solution: Dict):
+        """Persist a solution; the cache is only an optimization, so failures are logged, not raised."""
+        # Write to a unique temp file and rename, so concurrent writers (threads or
+        # processes) never share a temp path and readers never see a partial pickle
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(solution, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except (OSError, pickle.PicklingError):
+            logger.warning("Could not cache solution to %s", cache_path, exc_info=True)
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    
+    def _build_highs_model(self):
+        """
+        Assemble the baseline LP once into a persistent HiGHS instance and solve it.
+        Scenarios are applied afterwards as bound / row changes on this model.
+        """
+        plant_ids = self.plants['plant_id'].to_numpy()
+        dc_ids = self.dcs['dc_id'].to_numpy()
+        market_ids = self.markets['market_id'].to_numpy()
+        n_plants, n_dcs, n_markets = len(plant_ids), len(dc_ids), len(market_ids)
+        
+        # Edge endpoints as positions into the plant / DC / market tables
+        pr_from = pd.Index(plant_ids).get_indexer(self.plant_routes['from_id'])
+        pr_to = pd.Index(dc_ids).get_indexer(self.plant_routes['to_id'])
+        dr_from = pd.Index(dc_ids).get_indexer(self.dc_routes['from_id'])
+        dr_to = pd.Index(market_ids).get_indexer(self.dc_routes['to_id'])
+        n_pd, n_dm = len(pr_from), len(dr_from)
+        
+        # Variable layout: [plant->DC flows | DC->market flows]
+        # (production is substituted by plant outflow, unmet demand by demand - supply)
+        pd_idx = np.arange(n_pd)
+        dm_idx = n_pd + np.arange(n_dm)
+        n_vars = n_pd + n_dm
+        
+        # OBJECTIVE FUNCTION: Minimize total cost
+        production_c = np.zeros(n_vars)
+        plant_dc_c = np.zeros(n_vars)
+        dc_market_c = np.zeros(n_vars)
+        warehousing_c = np.zeros(n_vars)
+        production_c[pd_idx] = self.plants['cost_per_unit_eur'].to_numpy()[pr_from]
+        plant_dc_c[pd_idx] = self.plant_routes['cost_per_unit_eur'].to_numpy()
+        dc_market_c[dm_idx] = self.dc_routes['cost_per_unit_eur'].to_numpy()
+        warehousing_c[dm_idx] = self.dcs['variable_cost_per_unit_eur'].to_numpy()[dr_from]
+        c = production_c + plant_dc_c + dc_market_c + warehousing_c
+        
+        # Penalty on unmet = penalty * (demand - supply): the constant drops out of the
+        # argmin, leaving -penalty folded into every delivered unit
+        c[dm_idx] -= self.UNMET_PENALTY
+        
+        capacity = self.plants['capacity_annual_millions'].to_numpy(dtype=np.float64) * 1e6
+        demand = self.markets['annual_demand_millions'].to_numpy(dtype=np.float64) * 1e6
+        inf = highspy.kHighsInf
+        lower = np.zeros(n_vars)
+        upper = np.full(n_vars, inf)
+        
+        # Rows: [plant capacity (outflow <= cap) | DC balance | demand (supply <= demand)]
+        plant_row = np.arange(n_plants)
+        dc_row = n_plants + np.arange(n_dcs)
+        market_row = n_plants + n_dcs + np.arange(n_markets)
+        
+        rows = np.concatenate([
+            plant_row[pr_from],   # + plant outflow
+            dc_row[pr_to],        # + DC inflow
+            dc_row[dr_from],      # - DC outflow
+            market_row[dr_to]     # + market supply
+        ])
+        cols = np.concatenate([pd_idx, pd_idx, dm_idx, dm_idx])
+        data = np.concatenate([np.ones(n_pd), np.ones(n_pd), -np.ones(n_dm), np.ones(n_dm)])
+        n_rows = n_plants + n_dcs + n_markets
+        A = coo_matrix((data, (rows, cols)), shape=(n_rows, n_vars)).tocsr()
+        row_lower = np.concatenate([np.full(n_plants, -inf), np.zeros(n_dcs), np.full(n_markets, -inf)])
+        row_upper = np.concatenate([capacity, np.zeros(n_dcs), demand])
+        
+        highs = highspy.Highs()
+        highs.setOptionValue('output_flag', False)
+        highs.setOptionValue('solver', 'simplex')
+        highs.setOptionValue('simplex_strategy', 1)  # Dual simplex
+        highs.setOptionValue('time_limit', 30.0)
+        highs.addCols(n_vars, c, lower, upper, 0, np.array([], dtype=np.int32),
+                      np.array([], dtype=np.int32), np.array([]))
+        highs.addRows(n_rows, row_lower, row_upper, A.nnz, A.indptr[:-1].astype(np.int32),
+                      A.indices.astype(np.int32), A.data)
+        highs.run()
+        
+        if highs.getModelStatus() != highspy.HighsModelStatus.kOptimal:
+            raise RuntimeError(
+                f"Optimization failed with status: {highs.modelStatusToString(highs.getModelStatus())}"
+            )
+        
+        self._highs = highs
+        self._base_basis = highs.getBasis()
+        self._lp = {
+            'plant_ids': plant_ids, 'dc_ids': dc_ids, 'market_ids': market_ids,
+            'pr_from': pr_from, 'pr_to': pr_to, 'dr_from': dr_from, 'dr_to': dr_to,
+            'plant_row': plant_row.astype(np.int32), 'pd_idx': pd_idx, 'dm_idx': dm_idx,
+            'capacity': capacity, 'demand': demand,
+            'production_c': production_c, 'plant_dc_c': plant_dc_c, 'dc_market_c': dc_market_c,
+            'warehousing_c': warehousing_c,
+            'fixed_warehousing': float(self.dcs['fixed_cost_monthly_eur'].sum()) * 12
+        }
+    
+    def _solve_highs(self, scenario_name: str, constraints: Dict) -> Dict:
+        """
+        Solve the network LP in-process with HiGHS (highspy), warm-started from the
+        baseline basis. Same model as _solve_pulp, assembled directly as sparse
+        matrices from NumPy index arrays over the route edge lists.
         
         Args:
             scenario_name: Identifier for the scenario
@@ -66,166 +360,305 @@ class NetworkOptimizer:
         Returns:
             Dictionary containing solution, costs, flows, and KPIs
         """
-        # Create the optimization problem
-        prob = pulp.LpProblem(f"RedBull_Network_{scenario_name}", pulp.LpMinimize)
+        with self._model_lock:
+            if self._highs is None:
+                self._build_highs_model()
+            highs, lp = self._highs, self._lp
+            
+            # Start every scenario from the baseline basis so results don't depend on solve order
+            highs.setBasis(self._base_basis)
+            
+            # Disabled plants: cap outflow at zero
+            disabled = np.isin(lp['plant_ids'], constraints.get('disabled_plants', []))
+            n_plants = len(lp['plant_row'])
+            no_lower = np.full(n_plants, -highspy.kHighsInf)
+            if disabled.any():
+                highs.changeRowsBounds(n_plants, lp['plant_row'], no_lower,
+                                       np.where(disabled, 0.0, lp['capacity']))
+            
+            # Minimum fill rate constraint (if specified): total supply >= fill rate * demand
+            if 'min_fill_rate' in constraints:
+                dm_idx = lp['dm_idx']
+                highs.addRow(lp['demand'].sum() * constraints['min_fill_rate'], highspy.kHighsInf,
+                             len(dm_idx), dm_idx.astype(np.int32), np.ones(len(dm_idx)))
+            
+            # SOLVE
+            highs.run()
+            status = highs.getModelStatus()
+            x = np.array(highs.getSolution().col_value) if status == highspy.HighsModelStatus.kOptimal else None
+            
+            # Restore the baseline model for the next scenario
+            if 'min_fill_rate' in constraints:
+                n_rows = highs.getNumRow()
+                highs.deleteRows(1, np.array([n_rows - 1], dtype=np.int32))
+            if disabled.any():
+                highs.changeRowsBounds(n_plants, lp['plant_row'], no_lower, lp['capacity'])
+        
+        if x is None:
+            raise RuntimeError(f"Optimization failed with status: {highs.modelStatusToString(status)}")
+        
+        plant_ids, dc_ids, market_ids = lp['plant_ids'], lp['dc_ids'], lp['market_ids']
+        pr_from, pr_to, dr_from, dr_to = lp['pr_from'], lp['pr_to'], lp['dr_from'], lp['dr_to']
+        pd_flow, dm_flow = x[lp['pd_idx']], x[lp['dm_idx']]
+        supply = np.bincount(dr_to, weights=dm_flow, minlength=len(market_ids))
+        unmet = np.maximum(lp['demand'] - supply, 0.0)
+        pd_keep, dm_keep, unmet_keep = pd_flow > 0.1, dm_flow > 0.1, unmet > 0.1
+        
+        fixed_warehousing = lp['fixed_warehousing']
+        cost_breakdown = {
+            'production': float(lp['production_c'] @ x),
+            'transport_plant_dc': float(lp['plant_dc_c'] @ x),
+            'transport_dc_market': float(lp['dc_market_c'] @ x),
+            'warehousing': fixed_warehousing + float(lp['warehousing_c'] @ x),
+            'unmet_penalty': self.UNMET_PENALTY * float(unmet.sum())
+        }
+        
+        # Build solution dictionary (same schema as the PuLP backend)
+        solution = {
+            'scenario': scenario_name,
+            'status': 'Optimal',
+            'objective_value': sum(cost_breakdown.values()),
+            'production': dict(zip(
+                plant_ids.tolist(),
+                np.bincount(pr_from, weights=pd_flow, minlength=len(plant_ids)).tolist()
+            )),
+            'plant_to_dc_flows': dict(zip(
+                zip(plant_ids[pr_from[pd_keep]].tolist(), dc_ids[pr_to[pd_keep]].tolist()),
+                pd_flow[pd_keep].tolist()
+            )),
+            'dc_to_market_flows': dict(zip(
+                zip(dc_ids[dr_from[dm_keep]].tolist(), market_ids[dr_to[dm_keep]].tolist()),
+                dm_flow[dm_keep].tolist()
+            )),
+            'unmet_demand': dict(zip(market_ids[unmet_keep].tolist(), unmet[unmet_keep].tolist())),
+            'cost_breakdown': cost_breakdown
+        }
+        
+        return solution
+    
+
+    def _build_model(self) -> Dict:
+        """
+        Build the baseline PuLP model once for the loaded network.
+        The structure depends only on the network, so scenarios are applied
+        afterwards by _apply_scenario as right-hand-side changes and extra rows.
+        
+        Returns:
+            Dictionary holding the problem, its variables and cost expressions
+        """
+        prob = pulp.LpProblem("RedBull_Network", pulp.LpMinimize)
+        
+        # Route columns as plain arrays
+        pr_from = self.plant_routes['from_id'].to_numpy()
+        pr_to = self.plant_routes['to_id'].to_numpy()
+        pr_cost = self.plant_routes['cost_per_unit_eur'].to_numpy()
+        dr_from = self.dc_routes['from_id'].to_numpy()
+        dr_to = self.dc_routes['to_id'].to_numpy()
+        dr_cost = self.dc_routes['cost_per_unit_eur'].to_numpy()
         
         # Decision variables
-        production = {}  # How much to produce at each plant
+        # (production is substituted by plant outflow, unmet demand by demand - supply)
         plant_to_dc = {}  # Flow from plants to DCs
         dc_to_market = {}  # Flow from DCs to markets
-        unmet_demand = {}  # Demand not fulfilled (penalized)
-        
-        # Production variables
-        for _, plant in self.plants.iterrows():
-            plant_id = plant['plant_id']
-            production[plant_id] = pulp.LpVariable(
-                f"production_{plant_id}",
-                lowBound=0,
-                upBound=plant['capacity_annual_millions'] * 1e6,  # Convert to units
-                cat='Continuous'
-            )
         
         # Plant to DC flow variables
-        for _, route in self.routes[self.routes['from_type'] == 'plant'].iterrows():
-            key = (route['from_id'], route['to_id'])
-            plant_to_dc[key] = pulp.LpVariable(
-                f"flow_P_{route['from_id']}_to_{route['to_id']}",
+        for from_id, to_id in zip(pr_from, pr_to):
+            plant_to_dc[(from_id, to_id)] = pulp.LpVariable(
+                f"flow_P_{from_id}_to_{to_id}",
                 lowBound=0,
                 cat='Continuous'
             )
         
         # DC to Market flow variables
-        for _, route in self.routes[self.routes['from_type'] == 'dc'].iterrows():
-            key = (route['from_id'], route['to_id'])
-            dc_to_market[key] = pulp.LpVariable(
-                f"flow_DC_{route['from_id']}_to_{route['to_id']}",
+        for from_id, to_id in zip(dr_from, dr_to):
+            dc_to_market[(from_id, to_id)] = pulp.LpVariable(
+                f"flow_DC_{from_id}_to_{to_id}",
                 lowBound=0,
                 cat='Continuous'
             )
         
-        # Unmet demand variables
-        for _, market in self.markets.iterrows():
-            market_id = market['market_id']
-            unmet_demand[market_id] = pulp.LpVariable(
-                f"unmet_{market_id}",
-                lowBound=0,
-                upBound=market['annual_demand_millions'] * 1e6,
-                cat='Continuous'
-            )
-        
         # OBJECTIVE FUNCTION: Minimize total cost
-        production_cost = pulp.lpSum([
-            production[p['plant_id']] * p['cost_per_unit_eur']
-            for _, p in self.plants.iterrows()
-        ])
+        # Expressions are built from (variable, coefficient) pairs directly,
+        # skipping lpSum's term-by-term accumulation; pairs are streamed from
+        # generators so no intermediate term lists are materialized
+        plant_cost = dict(zip(self.plants['plant_id'], self.plants['cost_per_unit_eur']))
+        production_cost = pulp.LpAffineExpression(
+            (var, plant_cost[plant_id]) for (plant_id, _), var in plant_to_dc.items()
+        )
         
-        transport_cost_plant_dc = pulp.lpSum([
-            plant_to_dc[(r['from_id'], r['to_id'])] * r['cost_per_unit_eur']
-            for _, r in self.routes[self.routes['from_type'] == 'plant'].iterrows()
-        ])
+        transport_cost_plant_dc = pulp.LpAffineExpression(
+            (plant_to_dc[(f, t)], c) for f, t, c in zip(pr_from, pr_to, pr_cost)
+        )
         
-        transport_cost_dc_market = pulp.lpSum([
-            dc_to_market[(r['from_id'], r['to_id'])] * r['cost_per_unit_eur']
-            for _, r in self.routes[self.routes['from_type'] == 'dc'].iterrows()
-        ])
+        transport_cost_dc_market = pulp.LpAffineExpression(
+            (dc_to_market[(f, t)], c) for f, t, c in zip(dr_from, dr_to, dr_cost)
+        )
         
-        warehousing_cost = pulp.lpSum([
-            # Fixed monthly cost * 12 months + variable cost per unit flowing through
-            (dc['fixed_cost_monthly_eur'] * 12) + 
-            pulp.lpSum([
-                dc_to_market.get((dc['dc_id'], m['market_id']), 0) * dc['variable_cost_per_unit_eur']
-                for _, m in self.markets.iterrows()
-            ])
-            for _, dc in self.dcs.iterrows()
-        ])
+        # Fixed monthly cost * 12 months + variable cost per unit flowing through,
+        # over existing DC->market edges only
+        dc_variable = dict(zip(self.dcs['dc_id'], self.dcs['variable_cost_per_unit_eur']))
+        fixed_total = float(self.dcs['fixed_cost_monthly_eur'].sum()) * 12
+        warehousing_cost = pulp.LpAffineExpression(
+            ((var, dc_variable[dc_id]) for (dc_id, _), var in dc_to_market.items()),
+            constant=fixed_total
+        )
         
-        # Unmet demand penalty (€5 per unit = lost revenue + brand damage)
-        unmet_penalty = pulp.lpSum([
-            unmet_demand[m['market_id']] * 5.0
-            for _, m in self.markets.iterrows()
-        ])
+        # Unmet demand penalty = penalty * (total demand - delivered supply)
+        total_demand = sum(self.markets['annual_demand_millions']) * 1e6
+        unmet_penalty = pulp.LpAffineExpression(
+            ((var, -self.UNMET_PENALTY) for var in dc_to_market.values()),
+            constant=self.UNMET_PENALTY * total_demand
+        )
         
         prob += (production_cost + transport_cost_plant_dc + 
                 transport_cost_dc_market + warehousing_cost + unmet_penalty), "Total_Cost"
         
         # CONSTRAINTS
         
-        # 1. Plant capacity constraints
-        for _, plant in self.plants.iterrows():
-            plant_id = plant['plant_id']
+        # 1. Plant capacity constraints (production = plant outflow)
+        capacity = {}
+        plants = self.plants[['plant_id', 'capacity_annual_millions']].itertuples(index=False, name=None)
+        for plant_id, capacity_millions in plants:
+            production = pulp.LpAffineExpression(
+                (plant_to_dc[(plant_id, dc_id)], 1) for dc_id in self.plant_out[plant_id]
+            )
+            capacity[plant_id] = capacity_millions * 1e6
+            prob += production <= capacity[plant_id], f"Capacity_{plant_id}"
+        
+        # 2. Flow conservation at DCs: inflow = outflow
+        for dc_id in self.dcs['dc_id']:
+            balance = pulp.LpAffineExpression(chain(
+                ((plant_to_dc[(plant_id, dc_id)], 1) for plant_id in self.dc_in[dc_id]),
+                ((dc_to_market[(dc_id, market_id)], -1) for market_id in self.dc_out[dc_id])
+            ))
+            prob += balance == 0, f"DC_balance_{dc_id}"
+        
+        # 3. Demand fulfillment at markets
+        markets = self.markets[['market_id', 'annual_demand_millions']].itertuples(index=False, name=None)
+        for market_id, demand_millions in markets:
+            demand = demand_millions * 1e6
             
-            # Check if plant is disabled in this scenario
-            if 'disabled_plants' in constraints and plant_id in constraints['disabled_plants']:
-                prob += production[plant_id] == 0, f"Disabled_{plant_id}"
-            else:
-                prob += production[plant_id] <= plant['capacity_annual_millions'] * 1e6, \
-                        f"Capacity_{plant_id}"
-        
-        # 2. Flow conservation at plants: production = outflow
-        for _, plant in self.plants.iterrows():
-            plant_id = plant['plant_id']
-            outflow = pulp.lpSum([
-                plant_to_dc.get((plant_id, dc['dc_id']), 0)
-                for _, dc in self.dcs.iterrows()
-            ])
-            prob += production[plant_id] == outflow, f"Plant_balance_{plant_id}"
-        
-        # 3. Flow conservation at DCs: inflow = outflow
-        for _, dc in self.dcs.iterrows():
-            dc_id = dc['dc_id']
-            inflow = pulp.lpSum([
-                plant_to_dc.get((p['plant_id'], dc_id), 0)
-                for _, p in self.plants.iterrows()
-            ])
-            outflow = pulp.lpSum([
-                dc_to_market.get((dc_id, m['market_id']), 0)
-                for _, m in self.markets.iterrows()
-            ])
-            prob += inflow == outflow, f"DC_balance_{dc_id}"
-        
-        # 4. Demand fulfillment at markets
-        for _, market in self.markets.iterrows():
-            market_id = market['market_id']
-            demand = market['annual_demand_millions'] * 1e6
+            supply = pulp.LpAffineExpression(
+                (dc_to_market[(dc_id, market_id)], 1) for dc_id in self.market_in[market_id]
+            )
             
-            supply = pulp.lpSum([
-                dc_to_market.get((dc['dc_id'], market_id), 0)
-                for _, dc in self.dcs.iterrows()
-            ])
+            prob += supply <= demand, f"Demand_{market_id}"
+        
+        return {
+            'prob': prob,
+            'plant_to_dc': plant_to_dc,
+            'dc_to_market': dc_to_market,
+            'capacity': capacity,
+            'total_demand': total_demand,
+            'costs': {
+                'production': production_cost,
+                'transport_plant_dc': transport_cost_plant_dc,
+                'transport_dc_market': transport_cost_dc_market,
+                'warehousing': warehousing_cost,
+                'unmet_penalty': unmet_penalty
+            }
+        }
+    
+    def _apply_scenario(self, model: Dict, constraints: Dict) -> List[str]:
+        """
+        Re-parametrize the shared model for one scenario.
+        
+        Args:
+            model: Model built by _build_model
+            constraints: Additional constraints (disabled plants, min fill rate, etc.)
             
-            prob += supply + unmet_demand[market_id] == demand, f"Demand_{market_id}"
+        Returns:
+            Names of the rows added for this scenario (removed again after the solve)
+        """
+        prob = model['prob']
+        disabled = set(constraints.get('disabled_plants', []))
         
-        # 5. Minimum fill rate constraint (if specified)
+        # Disabled plants: outflow <= 0 (flows are non-negative, so outflow == 0)
+        for plant_id, capacity in model['capacity'].items():
+            prob.constraints[f"Capacity_{plant_id}"].constant = 0 if plant_id in disabled else -capacity
+        
+        # Minimum fill rate constraint (if specified): total supply >= fill rate * demand
+        added = []
         if 'min_fill_rate' in constraints:
-            total_demand = sum(self.markets['annual_demand_millions']) * 1e6
-            total_unmet = pulp.lpSum([unmet_demand[m['market_id']] for _, m in self.markets.iterrows()])
-            prob += total_unmet <= total_demand * (1 - constraints['min_fill_rate']), \
-                    f"Min_fill_rate_{constraints['min_fill_rate']}"
+            name = f"Min_fill_rate_{constraints['min_fill_rate']}"
+            total_supply = pulp.LpAffineExpression((var, 1) for var in model['dc_to_market'].values())
+            prob += total_supply >= model['total_demand'] * constraints['min_fill_rate'], name
+            added.append(name)
         
-        # SOLVE
-        solver = pulp.PULP_CBC_CMD(msg=0, timeLimit=30)  # 30 second time limit
-        prob.solve(solver)
+        return added
+    
+    def _pulp_command(self):
+        """PuLP solver command for the PuLP backends (30 second time limit)."""
+        if self.solver == 'gurobi':
+            command = pulp.GUROBI_CMD(msg=0, timeLimit=30)
+            if command.available():
+                return command
+        return pulp.PULP_CBC_CMD(msg=0, timeLimit=30)
+    
+    def _solve_pulp(self, scenario_name: str, constraints: Dict) -> Dict:
+        """
+        Solve the network LP with PuLP (CBC or Gurobi fallback backends), reusing
+        one model across scenarios.
+        
+        Args:
+            scenario_name: Identifier for the scenario
+            constraints: Additional constraints (disabled plants, min fill rate, etc.)
+            
+        Returns:
+            Dictionary containing solution, costs, flows, and KPIs
+        """
+        with self._model_lock:
+            if self._pulp_model is None:
+                self._pulp_model = self._build_model()
+            model = self._pulp_model
+            prob, plant_to_dc, dc_to_market = model['prob'], model['plant_to_dc'], model['dc_to_market']
+            
+            prob.name = f"RedBull_Network_{scenario_name}"
+            added = self._apply_scenario(model, constraints)
+            
+            # SOLVE
+            solver = self._pulp_command()
+            try:
+                prob.solve(solver)
+            finally:
+                for name in added:
+                    del prob.constraints[name]
+            
+            # Extract solution
+            if prob.status != pulp.LpStatusOptimal:
+                raise RuntimeError(f"Optimization failed with status: {pulp.LpStatus[prob.status]}")
+            
+            status = pulp.LpStatus[prob.status]
+            plant_flow_values = _var_values(plant_to_dc)
+            dc_flow_values = _var_values(dc_to_market)
+            objective_value = pulp.value(prob.objective)
+            cost_breakdown = {bucket: pulp.value(expr) for bucket, expr in model['costs'].items()}
         
-        # Extract solution
-        if prob.status != pulp.LpStatusOptimal:
-            raise RuntimeError(f"Optimization failed with status: {pulp.LpStatus[prob.status]}")
+        # Production is recovered as each plant's total outflow
+        production = dict.fromkeys(self.plants['plant_id'], 0.0)
+        for (plant_id, _), flow in zip(plant_to_dc.keys(), plant_flow_values.tolist()):
+            production[plant_id] += flow
+        
+        # Unmet demand is recovered as demand - delivered supply
+        supply = dict.fromkeys(self.markets['market_id'], 0.0)
+        for (_, market_id), flow in zip(dc_to_market.keys(), dc_flow_values.tolist()):
+            supply[market_id] += flow
+        unmet_demand = {}
+        for market_id, demand_millions in zip(self.markets['market_id'], self.markets['annual_demand_millions']):
+            unmet = float(demand_millions) * 1e6 - supply[market_id]
+            if unmet > 0.1:
+                unmet_demand[market_id] = unmet
         
         # Build solution dictionary
         solution = {
             'scenario': scenario_name,
-            'status': pulp.LpStatus[prob.status],
-            'objective_value': pulp.value(prob.objective),
-            'production': {p: pulp.value(production[p]) for p in production},
-            'plant_to_dc_flows': {k: pulp.value(v) for k, v in plant_to_dc.items() if pulp.value(v) > 0.1},
-            'dc_to_market_flows': {k: pulp.value(v) for k, v in dc_to_market.items() if pulp.value(v) > 0.1},
-            'unmet_demand': {m: pulp.value(unmet_demand[m]) for m in unmet_demand if pulp.value(unmet_demand[m]) > 0.1},
-            'cost_breakdown': {
-                'production': pulp.value(production_cost),
-                'transport_plant_dc': pulp.value(transport_cost_plant_dc),
-                'transport_dc_market': pulp.value(transport_cost_dc_market),
-                'warehousing': pulp.value(warehousing_cost),
-                'unmet_penalty': pulp.value(unmet_penalty)
-            }
+            'status': status,
+            'objective_value': objective_value,
+            'production': production,
+            'plant_to_dc_flows': _significant_values(plant_to_dc, plant_flow_values),
+            'dc_to_market_flows': _significant_values(dc_to_market, dc_flow_values),
+            'unmet_demand': unmet_demand,
+            'cost_breakdown': cost_breakdown
         }
         
         return solution
@@ -3,22 +3,139 @@ Scenario Engine for Red Bull Network Optimization
 Manages different strategic scenarios with business context.
 """
 
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+import multiprocessing
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
 from .network_model import NetworkOptimizer
 from .kpi_calculator import KPICalculator
 
 
+# Static scenario catalogue, built once at import (treat as read-only)
+_SCENARIO_DEFINITIONS = [
+    {
+        "id": "baseline",
+        "name": "Current Network (Baseline)",
+        "objective": "Understand current performance",
+        "description": "Models existing network with actual costs and service levels. "
+                      "Provides benchmark for measuring improvement opportunities.",
+        "use_case": "Performance assessment, identifying gaps, strategic planning baseline",
+        "expected_outcome": "Establishes baseline metrics: cost, service level, resilience",
+        "trade_offs": "None - represents current state",
+        "priority": "high"
+    },
+    {
+        "id": "cost_optimized",
+        "name": "Cost Minimization",
+        "objective": "Maximize profitability",
+        "description": "Minimize total network cost while maintaining ≥90% fill rate. "
+                      "Allows model to find most efficient plant-DC-market flows.",
+        "use_case": "Budget pressure, margin improvement initiatives, efficiency programs",
+        "expected_outcome": "8-12% cost reduction through DC consolidation and production reallocation",
+        "trade_offs": "May increase lead times by 0.5-1 day, potentially higher CO2 emissions",
+        "priority": "high"
+    },
+    {
+        "id": "disruption",
+        "name": "Austria Plant Shutdown",
+        "objective": "Test supply chain resilience",
+        "description": "Simulate 3-month outage of largest production facility (40% of capacity). "
+                      "Tests network resilience and identifies backup capacity requirements.",
+        "use_case": "Risk assessment, contingency planning, resilience investment justification",
+        "expected_outcome": "Quantifies disruption impact: cost increase, service degradation, mitigation strategies",
+        "trade_offs": "13% fill rate drop during disruption, €20M+ cost increase",
+        "priority": "medium"
+    }
+]
+
+
+def _comparison_row(solution: Dict, kpis: Dict) -> Tuple[float, float, float]:
+    """(cost, fill rate, resilience) of one scenario, in _compute_deltas column order."""
+    return (solution['objective_value'], kpis['fill_rate']['value'],
+            kpis['network_resilience_score']['value'])
+
+
+def _compute_deltas(values: np.ndarray, base: np.ndarray) -> np.ndarray:
+    """
+    Vectorized deltas of scenario rows against the baseline row.
+    
+    Args:
+        values: (n, 3) array of (cost, fill rate, resilience) per scenario
+        base: Baseline (cost, fill rate, resilience)
+        
+    Returns:
+        (n, 4) array of (cost delta, cost % change, fill rate delta, resilience delta)
+    """
+    deltas = values - base
+    cost_pct = (values[:, 0] / base[0] - 1) * 100
+    return np.column_stack((deltas[:, 0], cost_pct, deltas[:, 1], deltas[:, 2]))
+
+
+# Scenario id -> NetworkOptimizer method that solves it
+_OPTIMIZE_FNS = {
+    'baseline': NetworkOptimizer.optimize_baseline,
+    'cost_optimized': NetworkOptimizer.optimize_cost_minimization,
+    'disruption': NetworkOptimizer.optimize_disruption_response
+}
+
+
+def _solve_worker(scenario_id: str, data_dir: str, solver: str) -> Dict:
+    """Solve one scenario in a worker process (module-level so it can be pickled)."""
+    return _OPTIMIZE_FNS[scenario_id](NetworkOptimizer(data_dir, solver=solver))
+
+
 class ScenarioEngine:
     """
     Manages optimization scenarios and generates business insights.
     Each scenario represents a different strategic objective.
     """
     
-    def __init__(self, data_dir='data'):
-        """Initialize scenario engine."""
-        self.optimizer = NetworkOptimizer(data_dir)
+    # Insight text templates (filled with str.format_map per run)
+    _FILL_GAP_DESCRIPTION = ("Current network fulfills {fill_rate:.1f}% of demand, "
+                             "missing {fill_gap:.1f}pp vs target. "
+                             "This translates to {fill_context}.")
+    _LOW_RESILIENCE_DESCRIPTION = ("Network resilience score of {resilience}/100 "
+                                   "indicates vulnerability to disruptions. "
+                                   "{resilience_context}")
+    _SAVINGS_TITLE = "€{savings_m:.1f}M Annual Cost Reduction Identified"
+    _SAVINGS_DESCRIPTION = ("Optimized network reduces costs by {savings_pct:.1f}% through "
+                            "strategic DC placement and production reallocation. "
+                            "Primary savings: {cost_driver}")
+    _TRADE_OFF_DESCRIPTION = ("Cost optimization reduced fill rate to {fill_rate:.1f}%. "
+                              "Consider if this trade-off is acceptable for mature markets.")
+    _DISRUPTION_DESCRIPTION = ("3-month Austria plant shutdown causes €{cost_increase_m:.1f}M cost increase "
+                               "({increase_pct:.0f}% above baseline). "
+                               "Fill rate drops to {fill_rate:.1f}% during disruption.")
+    _RESILIENCE_INVESTMENT_DESCRIPTION = ("Current resilience score: {resilience}/100. "
+                                          "Dual-sourcing strategy needed for top markets.")
+    
+    def __init__(self, data_dir='data', solver='highs'):
+        """
+        Initialize scenario engine.
+        
+        Args:
+            data_dir: Directory containing the network CSV files
+            solver: Optimizer backend, one of NetworkOptimizer.SOLVERS
+        """
+        self.optimizer = NetworkOptimizer(data_dir, solver=solver)
         self.kpi_calc = KPICalculator(data_dir)
         self.baseline_result = None
+        self.baseline_kpis = None
+        
+        # Baseline solution and KPIs are published and read as a pair (request threads
+        # can compare against the baseline while the warm-up thread is still evaluating it)
+        self._baseline_lock = Lock()
+        
+        # (scenario_id, data fingerprint) -> solution, so repeat runs skip the solve
+        self._solution_cache: Dict[Tuple[str, str], Dict] = {}
+        
+        # Scenario id -> insight builder
+        self._insight_builders = {
+            'baseline': self._baseline_insights,
+            'cost_optimized': self._cost_insights,
+            'disruption': self._disruption_insights
+        }
         
     def get_scenario_definitions(self) -> List[Dict]:
         """
@@ -27,41 +144,17 @@ class ScenarioEngine:
         Returns:
             List of scenario definitions with objectives and use cases
         """
-        return [
-            {
-                "id": "baseline",
-                "name": "Current Network (Baseline)",
-                "objective": "Understand current performance",
-                "description": "Models existing network with actual costs and service levels. "
-                              "Provides benchmark for measuring improvement opportunities.",
-                "use_case": "Performance assessment, identifying gaps, strategic planning baseline",
-                "expected_outcome": "Establishes baseline metrics: cost, service level, resilience",
-                "trade_offs": "None - represents current state",
-                "priority": "high"
-            },
-            {
-                "id": "cost_optimized",
-                "name": "Cost Minimization",
-                "objective": "Maximize profitability",
-                "description": "Minimize total network cost while maintaining ≥90% fill rate. "
-                              "Allows model to find most efficient plant-DC-market flows.",
-                "use_case": "Budget pressure, margin improvement initiatives, efficiency programs",
-                "expected_outcome": "8-12% cost reduction through DC consolidation and production reallocation",
-                "trade_offs": "May increase lead times by 0.5-1 day, potentially higher CO2 emissions",
-                "priority": "high"
-            },
-            {
-                "id": "disruption",
-                "name": "Austria Plant Shutdown",
-                "objective": "Test supply chain resilience",
-                "description": "Simulate 3-month outage of largest production facility (40% of capacity). "
-                              "Tests network resilience and identifies backup capacity requirements.",
-                "use_case": "Risk assessment, contingency planning, resilience investment justification",
-                "expected_outcome": "Quantifies disruption impact: cost increase, service degradation, mitigation strategies",
-                "trade_offs": "13% fill rate drop during disruption, €20M+ cost increase",
-                "priority": "medium"
-            }
-        ]
+        return _SCENARIO_DEFINITIONS
+    
+    def iter_scenario_summaries(self) -> Iterator[Tuple[str, str, str, str]]:
+        """
+        Iterate scenario headers without the long description/use-case fields.
+        
+        Yields:
+            (id, name, objective, expected_outcome) tuples in catalogue order
+        """
+        for scenario in _SCENARIO_DEFINITIONS:
+            yield scenario['id'], scenario['name'], scenario['objective'], scenario['expected_outcome']
     
     def run_scenario(self, scenario_id: str) -> Dict:
         """
@@ -75,26 +168,79 @@ class ScenarioEngine:
         """
         print(f"Running scenario: {scenario_id}...")
         
-        # Run optimization
-        if scenario_id == 'baseline':
-            solution = self.optimizer.optimize_baseline()
-            self.baseline_result = solution  # Store for comparisons
-        elif scenario_id == 'cost_optimized':
-            solution = self.optimizer.optimize_cost_minimization()
-        elif scenario_id == 'disruption':
-            solution = self.optimizer.optimize_disruption_response()
-        else:
-            raise ValueError(f"Unknown scenario: {scenario_id}")
+        # Run optimization (reusing the solution if this scenario already ran on the same data)
+        cache_key = (scenario_id, self.optimizer.data_fingerprint())
+        solution = self._solution_cache.get(cache_key)
+        if solution is None:
+            try:
+                optimize = _OPTIMIZE_FNS[scenario_id]
+            except KeyError:
+                raise ValueError(f"Unknown scenario: {scenario_id}") from None
+            solution = optimize(self.optimizer)
+            self._solution_cache[cache_key] = solution
+        
+        return self._evaluate(scenario_id, solution)
+    
+    def run_all_scenarios(self, parallel: bool = False) -> Dict[str, Dict]:
+        """
+        Run every scenario. Baseline runs first since the other scenarios are compared
+        against it; the rest are solved in-process one after another, reusing the
+        warm solver model.
+        
+        Args:
+            parallel: Solve the non-baseline scenarios in spawned worker processes instead.
+                Only worth it when single solves take seconds (much larger networks):
+                each worker re-imports the solver stack and cold-solves its own model.
+                Callers running as a script need an `if __name__ == '__main__':` guard.
+            
+        Returns:
+            Complete results keyed by scenario id
+        """
+        results = {'baseline': self.run_scenario('baseline')}
+        
+        fingerprint = self.optimizer.data_fingerprint()
+        pending = [
+            definition['id'] for definition in _SCENARIO_DEFINITIONS
+            if definition['id'] != 'baseline' and (definition['id'], fingerprint) not in self._solution_cache
+        ]
+        if parallel and pending:
+            # Spawned (not forked) workers, so no lock held by a parent thread is inherited
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=len(pending), mp_context=context) as executor:
+                futures = {
+                    scenario_id: executor.submit(
+                        _solve_worker, scenario_id, self.optimizer.data_dir, self.optimizer.solver
+                    )
+                    for scenario_id in pending
+                }
+                for scenario_id, future in futures.items():
+                    self._solution_cache[(scenario_id, fingerprint)] = future.result()
+        
+        # Remaining solves, KPIs, insights and comparisons run in-process
+        for definition in _SCENARIO_DEFINITIONS:
+            if definition['id'] != 'baseline':
+                results[definition['id']] = self.run_scenario(definition['id'])
+        
+        return results
+    
+    def _evaluate(self, scenario_id: str, solution: Dict) -> Dict:
+        """Calculate KPIs, insights and baseline comparison for a solved scenario."""
+        is_baseline = scenario_id == 'baseline'
         
         # Calculate KPIs
         kpis = self.kpi_calc.calculate_kpis(solution, scenario_id)
+        if is_baseline:
+            # Store for comparisons, only once both halves exist
+            with self._baseline_lock:
+                self.baseline_kpis = kpis
+                self.baseline_result = solution
         
         # Generate insights
         insights = self.generate_insights(solution, kpis, scenario_id)
         
         # Build comparison to baseline (if not baseline itself)
         comparison = None
-        if scenario_id != 'baseline' and self.baseline_result:
+        if not is_baseline and self.baseline_result:
             comparison = self.compare_to_baseline(solution, kpis)
         
         return {
@@ -117,96 +263,121 @@ class ScenarioEngine:
         Returns:
             List of prioritized insights with actions
         """
+        builder = self._insight_builders.get(scenario_id)
+        return builder(solution, kpis) if builder else []
+    
+    def _baseline_insights(self, solution: Dict, kpis: Dict) -> List[Dict]:
+        """Baseline insights: service and resilience gaps plus the optimization opportunity."""
+        fill_rate = kpis['fill_rate']
+        fill_value = fill_rate['value']
+        resilience = kpis['network_resilience_score']
+        resilience_value = resilience['value']
         insights = []
         
-        if scenario_id == 'baseline':
-            # Baseline insights
-            if kpis['fill_rate']['value'] < 100:
-                insights.append({
-                    'priority': 'high',
-                    'title': 'Service Level Gap Identified',
-                    'description': f"Current network fulfills {kpis['fill_rate']['value']:.1f}% of demand, "
-                                  f"missing {100 - kpis['fill_rate']['value']:.1f}pp vs target. "
-                                  f"This translates to {kpis['fill_rate']['context']}.",
-                    'impact': kpis['fill_rate']['impact'],
-                    'implementation': 'Capacity expansion in constrained regions (18-24 month timeline)'
-                })
-            
-            if kpis['network_resilience_score']['value'] < 70:
-                insights.append({
-                    'priority': 'high',
-                    'title': 'Low Supply Chain Resilience',
-                    'description': f"Network resilience score of {kpis['network_resilience_score']['value']}/100 "
-                                  f"indicates vulnerability to disruptions. "
-                                  f"{kpis['network_resilience_score']['context']}",
-                    'impact': kpis['network_resilience_score']['impact'],
-                    'implementation': kpis['network_resilience_score']['action']
-                })
-            
-            # Always include cost optimization opportunity
+        if fill_value < 100:
             insights.append({
-                'priority': 'medium',
-                'title': 'Cost Optimization Opportunity',
-                'description': 'Run cost optimization scenario to quantify potential savings through network redesign.',
-                'impact': 'Typically 8-12% cost reduction achievable through DC consolidation and routing optimization',
-                'implementation': 'Phased approach: Analysis (2mo) → Planning (3mo) → Implementation (9mo)'
+                'priority': 'high',
+                'title': 'Service Level Gap Identified',
+                'description': self._FILL_GAP_DESCRIPTION.format_map({
+                    'fill_rate': fill_value,
+                    'fill_gap': 100 - fill_value,
+                    'fill_context': fill_rate['context']
+                }),
+                'impact': fill_rate['impact'],
+                'implementation': 'Capacity expansion in constrained regions (18-24 month timeline)'
             })
         
-        elif scenario_id == 'cost_optimized':
-            # Cost optimization insights
-            baseline_cost = self.baseline_result['objective_value'] if self.baseline_result else 338.7e6
-            savings = baseline_cost - solution['objective_value']
-            
-            if savings > 0:
-                insights.append({
-                    'priority': 'high',
-                    'title': f'€{savings/1e6:.1f}M Annual Cost Reduction Identified',
-                    'description': f'Optimized network reduces costs by {(savings/baseline_cost)*100:.1f}% through '
-                                  f'strategic DC placement and production reallocation. '
-                                  f'Primary savings: {kpis["total_cost"]["driver"]}',
-                    'impact': kpis['total_cost']['impact'],
-                    'implementation': 'Recommended phased rollout: High-impact changes first (6mo), '
-                                     'then full network optimization (12mo total)'
-                })
-            
-            # Check if fill rate decreased
-            if kpis['fill_rate']['value'] < 95:
-                insights.append({
-                    'priority': 'medium',
-                    'title': 'Service Level Trade-off',
-                    'description': f"Cost optimization reduced fill rate to {kpis['fill_rate']['value']:.1f}%. "
-                                  f"Consider if this trade-off is acceptable for mature markets.",
-                    'impact': 'Slight service degradation may be acceptable in price-sensitive segments',
-                    'implementation': 'Segment markets: Premium (maintain 98%+) vs Standard (accept 90-95%)'
-                })
-        
-        elif scenario_id == 'disruption':
-            # Disruption insights
-            baseline_cost = self.baseline_result['objective_value'] if self.baseline_result else 338.7e6
-            cost_increase = solution['objective_value'] - baseline_cost
-            
+        if resilience_value < 70:
             insights.append({
                 'priority': 'high',
-                'title': f'Critical Single Point of Failure: Austria Plant',
-                'description': f'3-month Austria plant shutdown causes €{cost_increase/1e6:.1f}M cost increase '
-                              f'({(cost_increase/baseline_cost)*100:.0f}% above baseline). '
-                              f'Fill rate drops to {kpis["fill_rate"]["value"]:.1f}% during disruption.',
-                'impact': 'Potential quarterly revenue loss of €47M+ based on 2021 precedent',
-                'implementation': 'URGENT: Establish backup production agreements + increase safety stock in Europe'
+                'title': 'Low Supply Chain Resilience',
+                'description': self._LOW_RESILIENCE_DESCRIPTION.format_map({
+                    'resilience': resilience_value,
+                    'resilience_context': resilience['context']
+                }),
+                'impact': resilience['impact'],
+                'implementation': resilience['action']
             })
-            
+        
+        # Always include cost optimization opportunity
+        insights.append({
+            'priority': 'medium',
+            'title': 'Cost Optimization Opportunity',
+            'description': 'Run cost optimization scenario to quantify potential savings through network redesign.',
+            'impact': 'Typically 8-12% cost reduction achievable through DC consolidation and routing optimization',
+            'implementation': 'Phased approach: Analysis (2mo) → Planning (3mo) → Implementation (9mo)'
+        })
+        
+        return insights
+    
+    def _cost_insights(self, solution: Dict, kpis: Dict) -> List[Dict]:
+        """Cost optimization insights: savings found and any service trade-off."""
+        objective = solution['objective_value']
+        fill_value = kpis['fill_rate']['value']
+        total_cost = kpis['total_cost']
+        insights = []
+        
+        baseline_cost = self.baseline_result['objective_value'] if self.baseline_result else 338.7e6
+        savings = baseline_cost - objective
+        
+        if savings > 0:
             insights.append({
                 'priority': 'high',
-                'title': 'Resilience Investment Required',
-                'description': f'Current resilience score: {kpis["network_resilience_score"]["value"]}/100. '
-                              f'Dual-sourcing strategy needed for top markets.',
-                'impact': 'Investment: €12M (capacity agreements + inventory). ROI: Positive if disruption risk >15% over 3 years',
-                'implementation': kpis['network_resilience_score']['action']
+                'title': self._SAVINGS_TITLE.format_map({'savings_m': savings / 1e6}),
+                'description': self._SAVINGS_DESCRIPTION.format_map({
+                    'savings_pct': (savings / baseline_cost) * 100,
+                    'cost_driver': total_cost['driver']
+                }),
+                'impact': total_cost['impact'],
+                'implementation': 'Recommended phased rollout: High-impact changes first (6mo), '
+                                 'then full network optimization (12mo total)'
+            })
+        
+        # Check if fill rate decreased
+        if fill_value < 95:
+            insights.append({
+                'priority': 'medium',
+                'title': 'Service Level Trade-off',
+                'description': self._TRADE_OFF_DESCRIPTION.format_map({'fill_rate': fill_value}),
+                'impact': 'Slight service degradation may be acceptable in price-sensitive segments',
+                'implementation': 'Segment markets: Premium (maintain 98%+) vs Standard (accept 90-95%)'
             })
         
         return insights
     
-    def compare_to_baseline(self, solution: Dict, kpis: Dict) -> Dict:
+    def _disruption_insights(self, solution: Dict, kpis: Dict) -> List[Dict]:
+        """Disruption insights: single point of failure and resilience investment."""
+        objective = solution['objective_value']
+        fill_value = kpis['fill_rate']['value']
+        resilience = kpis['network_resilience_score']
+        
+        baseline_cost = self.baseline_result['objective_value'] if self.baseline_result else 338.7e6
+        cost_increase = objective - baseline_cost
+        
+        return [
+            {
+                'priority': 'high',
+                'title': 'Critical Single Point of Failure: Austria Plant',
+                'description': self._DISRUPTION_DESCRIPTION.format_map({
+                    'cost_increase_m': cost_increase / 1e6,
+                    'increase_pct': (cost_increase / baseline_cost) * 100,
+                    'fill_rate': fill_value
+                }),
+                'impact': 'Potential quarterly revenue loss of €47M+ based on 2021 precedent',
+                'implementation': 'URGENT: Establish backup production agreements + increase safety stock in Europe'
+            },
+            {
+                'priority': 'high',
+                'title': 'Resilience Investment Required',
+                'description': self._RESILIENCE_INVESTMENT_DESCRIPTION.format_map({
+                    'resilience': resilience['value']
+                }),
+                'impact': 'Investment: €12M (capacity agreements + inventory). ROI: Positive if disruption risk >15% over 3 years',
+                'implementation': resilience['action']
+            }
+        ]
+    
+    def compare_to_baseline(self, solution: Dict, kpis: Dict) -> Optional[Dict]:
         """
         Compare scenario results to baseline.
         
@@ -217,26 +388,61 @@ class ScenarioEngine:
         Returns:
             Dictionary of comparisons with deltas
         """
-        if not self.baseline_result:
+        baseline = self._baseline_pair()
+        if baseline is None:
             return None
         
-        baseline_kpis = self.kpi_calc.calculate_kpis(self.baseline_result, 'baseline')
+        return self._compare([{'solution': solution, 'kpis': kpis}], *baseline)[0]
+    
+    def compare_many(self, results: List[Dict]) -> List[Dict]:
+        """
+        Compare several scenario results to baseline in one vectorized pass
+        (e.g. for what-if sweeps).
         
-        return {
-            'cost_delta': {
-                'value': solution['objective_value'] - self.baseline_result['objective_value'],
-                'percentage': ((solution['objective_value'] / self.baseline_result['objective_value']) - 1) * 100,
-                'interpretation': 'savings' if solution['objective_value'] < self.baseline_result['objective_value'] else 'increase'
-            },
-            'fill_rate_delta': {
-                'value': kpis['fill_rate']['value'] - baseline_kpis['fill_rate']['value'],
-                'interpretation': 'improvement' if kpis['fill_rate']['value'] > baseline_kpis['fill_rate']['value'] else 'degradation'
-            },
-            'resilience_delta': {
-                'value': kpis['network_resilience_score']['value'] - baseline_kpis['network_resilience_score']['value'],
-                'interpretation': 'stronger' if kpis['network_resilience_score']['value'] > baseline_kpis['network_resilience_score']['value'] else 'weaker'
+        Args:
+            results: Scenario results with 'solution' and 'kpis' (as returned by run_scenario)
+            
+        Returns:
+            One comparison dictionary per result, in the same shape as compare_to_baseline
+        """
+        baseline = self._baseline_pair()
+        if baseline is None:
+            raise RuntimeError("Run the baseline scenario before comparing against it")
+        
+        return self._compare(results, *baseline)
+    
+    def _baseline_pair(self) -> Optional[Tuple[Dict, Dict]]:
+        """Consistent (baseline solution, baseline KPIs) snapshot, or None until both are set."""
+        with self._baseline_lock:
+            if self.baseline_result is None or self.baseline_kpis is None:
+                return None
+            return self.baseline_result, self.baseline_kpis
+    
+    def _compare(self, results: List[Dict], baseline_result: Dict, baseline_kpis: Dict) -> List[Dict]:
+        """Comparison dictionaries for results against the given baseline snapshot."""
+        values = np.array([_comparison_row(r['solution'], r['kpis']) for r in results], dtype=np.float64)
+        base = np.array(_comparison_row(baseline_result, baseline_kpis), dtype=np.float64)
+        deltas = _compute_deltas(values.reshape(-1, 3), base)
+        
+        # Dict wrapping is the only per-scenario Python work left
+        return [
+            {
+                'cost_delta': {
+                    'value': cost_delta,
+                    'percentage': cost_pct,
+                    'interpretation': 'savings' if cost_delta < 0 else 'increase'
+                },
+                'fill_rate_delta': {
+                    'value': fill_delta,
+                    'interpretation': 'improvement' if fill_delta > 0 else 'degradation'
+                },
+                'resilience_delta': {
+                    'value': int(resilience_delta),  # Resilience scores are whole points
+                    'interpretation': 'stronger' if resilience_delta > 0 else 'weaker'
+                }
             }
-        }
+            for cost_delta, cost_pct, fill_delta, resilience_delta in deltas.tolist()
+        ]
 
 
 def test_scenario_engine():
@@ -247,10 +453,10 @@ def test_scenario_engine():
     
     # Get scenario definitions
     print("Available Scenarios:")
-    for scenario in engine.get_scenario_definitions():
-        print(f"\n  {scenario['name']} ({scenario['id']})")
-        print(f"  Objective: {scenario['objective']}")
-        print(f"  Expected: {scenario['expected_outcome']}")
+    for scenario_id, name, objective, expected_outcome in engine.iter_scenario_summaries():
+        print(f"\n  {name} ({scenario_id})")
+        print(f"  Objective: {objective}")
+        print(f"  Expected: {expected_outcome}")
     
     # Run baseline
     print("\n\n=== Running Baseline Scenario ===")
@@ -52,11 +52,16 @@ async function initializeNetworkMap() {
             maxZoom: 18
         }).addTo(networkMap);
         
-        // Load network data
-        const response = await fetch(`${API_BASE}/api/network-data`);
-        const data = await response.json();
+        // Load network data (static topology is HTTP-cached; flows change per solve)
+        const [topologyResponse, flowsResponse] = await Promise.all([
+            fetch(`${API_BASE}/api/topology`),
+            fetch(`${API_BASE}/api/flows?scenario=baseline`)
+        ]);
+        const topology = await topologyResponse.json();
+        const flowData = await flowsResponse.json();
         
-        if (data.success) {
+        if (topology.success && flowData.success) {
+            const data = { ...topology, flows: flowData.flows };
             networkData = data;
             createMapLayers(data);
             setupLayerControls();
@@ -0,0 +1,30 @@
+"""
+orjson-backed JSON provider for Flask
+Serializes API responses with orjson's C encoder, including NumPy scalars and arrays.
+"""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Drop-in replacement for Flask's stdlib-json provider.
+    Falls back to Flask's default handler for types orjson doesn't know (dates, Markup, etc.).
+    """
+
+    sort_keys = False
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize data as a JSON string."""
+        option = self.option
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize JSON from a string or UTF-8 bytes."""
+        return orjson.loads(s)
@@ -0,0 +1,36 @@
+"""
+Typed response models for the optimization API
+msgspec Structs compile a schema-specialized JSON encoder for fixed-shape payloads.
+"""
+
+import msgspec
+import numpy as np
+from typing import Any, Dict, List, Optional
+
+
+class SolutionSummary(msgspec.Struct):
+    """Headline numbers of a solved scenario."""
+    total_cost: float
+    status: str
+    production_by_plant: Dict[str, float]
+    cost_breakdown: Dict[str, float]
+
+
+class OptimizeResponse(msgspec.Struct):
+    """Body of a successful /api/optimize response."""
+    success: bool
+    scenario_id: str
+    kpis: Dict[str, Dict[str, Any]]
+    insights: List[Dict[str, Any]]
+    comparison: Optional[Dict[str, Any]]
+    solution_summary: SolutionSummary
+
+
+def _enc_hook(obj):
+    """Convert NumPy scalars (e.g. pandas-derived KPI values) to native Python types."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise NotImplementedError(f"Objects of type {type(obj)} are not supported")
+
+
+encoder = msgspec.json.Encoder(enc_hook=_enc_hook)